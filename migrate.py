@@ -19,10 +19,12 @@ import os
 import re
 import shutil
 import sys
-import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
 from urllib.parse import urlparse, urljoin
 
 import requests
+from urllib3.util.retry import Retry
 
 from migrator.crawler import GitBookCrawler
 from migrator.scraper import GitBookScraper
@@ -31,12 +33,28 @@ from migrator.branding import BrandingExtractor, BrandAssets
 from migrator.config import build_docs_json, write_docs_json
 from migrator.summary_parser import parse_summary, build_nav_from_summary, inject_nav_icons, _to_mintlify_path
 from migrator.markdown_converter import MarkdownConverter
-from migrator.utils import ensure_dir
+from migrator.utils import clean_asset_filename, ensure_dir
 
 
 def create_session() -> requests.Session:
     """Create an HTTP session with appropriate headers."""
     session = requests.Session()
+    # Back off and retry only when the site rate-limits or is briefly
+    # unavailable (honouring Retry-After); connection errors and timeouts
+    # still fail immediately
+    retry = Retry(
+        total=None,
+        connect=0,
+        read=0,
+        other=0,
+        status=4,
+        status_forcelist=(429, 503),
+        backoff_factor=1,
+        respect_retry_after_header=True,
+    )
+    adapter = requests.adapters.HTTPAdapter(max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
     session.headers.update({
         'User-Agent': 'Mozilla/5.0 (Mintlify Migration Tool) AppleWebKit/537.36',
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -162,6 +180,47 @@ def _filter_hidden_pages(pages: list, hidden_pages: set) -> list:
     return result
 
 
+# Per-process converter used by _convert_page (set by _init_page_worker)
+_page_converter: Optional[MarkdownConverter] = None
+
+
+def _init_page_worker(source_dir: str):
+    """Create the converter a (worker) process uses for its pages."""
+    global _page_converter
+    _page_converter = MarkdownConverter(base_path=source_dir)
+
+
+def _convert_page(page) -> Optional[tuple[str, list, bool]]:
+    """Convert one SUMMARY.md page.
+
+    Returns (mdx, qa_issues, hidden), or None if the source file is missing.
+    """
+    source_file = os.path.join(_page_converter.base_path, page.path)
+    if not os.path.isfile(source_file):
+        return None
+
+    with open(source_file, 'r', encoding='utf-8', errors='replace') as f:
+        md_content = f.read()
+
+    mdx = _page_converter.convert(md_content, title=page.title, page_path=page.path,
+                                  sidebar_title=page.sidebar_title)
+    return mdx, list(_page_converter.qa_issues), _page_converter.page_hidden
+
+
+def _convert_pages(source_dir: str, pages: list, jobs: int):
+    """Yield _convert_page results in page order, using up to `jobs` processes."""
+    workers = min(jobs, len(pages))
+    if workers <= 1:
+        _init_page_worker(source_dir)
+        yield from map(_convert_page, pages)
+        return
+
+    # Pages convert independently; regex work is CPU-bound, so use processes
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_page_worker,
+                             initargs=(source_dir,)) as executor:
+        yield from executor.map(_convert_page, pages, chunksize=4)
+
+
 def _fetch_remote_branding(url: str, assets: BrandAssets, output_dir: str) -> BrandAssets:
     """Pass 2: Fetch branding from a live GitBook site.
 
@@ -264,7 +323,8 @@ def _prompt_branding(assets: BrandAssets, source_dir: str, images_dir: str) -> B
     return assets
 
 
-def run_directory_migration(source_dir: str, output_dir: str, interactive: bool = True, url: str = None):
+def run_directory_migration(source_dir: str, output_dir: str, interactive: bool = True, url: str = None,
+                            jobs: Optional[int] = None):
     """Migrate from a local GitBook directory (with SUMMARY.md)."""
     print()
     print("=" * 60)
@@ -328,7 +388,7 @@ def run_directory_migration(source_dir: str, output_dir: str, interactive: bool
             src = os.path.join(gitbook_assets, fname)
             if os.path.isfile(src):
                 # Clean filename
-                clean_name = re.sub(r'[^\w.\-]', '-', fname)
+                clean_name = clean_asset_filename(fname)
                 dst = os.path.join(images_dir, clean_name)
                 try:
                     shutil.copy2(src, dst)
@@ -363,36 +423,29 @@ def run_directory_migration(source_dir: str, output_dir: str, interactive: bool
     # Step 4: Convert pages
     print()
     print(f"[4/5] Converting {len(all_pages)} pages...")
-    converter = MarkdownConverter(base_path=source_dir)
     pages_written = []
     all_qa_issues = []
     failed_pages = []
     hidden_pages = set()
 
-    for i, page in enumerate(all_pages):
+    results = _convert_pages(source_dir, all_pages, jobs or os.cpu_count() or 1)
+    for i, (page, converted) in enumerate(zip(all_pages, results)):
         progress = f"  [{i+1}/{len(all_pages)}]"
         print(f"{progress} {page.title}...", end='', flush=True)
 
-        # Read source file
-        source_file = os.path.join(source_dir, page.path)
-        if not os.path.isfile(source_file):
+        if converted is None:
             print(" ✗ (file not found)")
             failed_pages.append(page)
             continue
 
-        with open(source_file, 'r', encoding='utf-8', errors='replace') as f:
-            md_content = f.read()
-
-        # Convert
-        mdx = converter.convert(md_content, title=page.title, page_path=page.path,
-                                sidebar_title=page.sidebar_title)
+        mdx, qa_issues, hidden = converted
 
-        if converter.qa_issues:
+        if qa_issues:
             all_qa_issues.extend(
-                [(page.mintlify_path, issue) for issue in converter.qa_issues]
+                [(page.mintlify_path, issue) for issue in qa_issues]
             )
 
-        if converter.page_hidden:
+        if hidden:
             hidden_pages.add(page.mintlify_path)
 
         # Write output
@@ -463,7 +516,7 @@ def run_directory_migration(source_dir: str, output_dir: str, interactive: bool
 #  URL MODE — scrapes a live GitBook site
 # ============================================================
 
-def run_url_migration(url: str, output_dir: str, interactive: bool = True):
+def run_url_migration(url: str, output_dir: str, interactive: bool = True, jobs: Optional[int] = None):
     """Migrate from a live GitBook URL."""
     print()
     print("=" * 60)
@@ -544,7 +597,8 @@ def run_url_migration(url: str, output_dir: str, interactive: bool = True):
     # Scrape + convert
     print()
     print(f"[4/6] Scraping and converting {len(pages)} pages...")
-    scraper = GitBookScraper(session)
+    # One session per scraping thread; requests.Session isn't guaranteed thread-safe
+    scraper = GitBookScraper(session, session_factory=create_session)
     image_counter = {'count': 0}
 
     def image_handler(src, page_url):
@@ -555,13 +609,13 @@ def run_url_migration(url: str, output_dir: str, interactive: bool = True):
     all_qa_issues = []
     failed_pages = []
 
-    for i, page in enumerate(pages):
+    results = scraper.scrape_pages([page.url for page in pages], jobs or 4)
+    for i, (page, (content, error)) in enumerate(zip(pages, results)):
         progress = f"  [{i+1}/{len(pages)}]"
         print(f"{progress} {page.title}...", end='', flush=True)
 
-        content = scraper.scrape_page(page.url)
         if not content:
-            print(" ✗ (failed to scrape)")
+            print(f" ✗ (failed to scrape: {error})")
             failed_pages.append(page)
             continue
 
@@ -581,7 +635,6 @@ def run_url_migration(url: str, output_dir: str, interactive: bool = True):
 
         pages_written.append(page.path)
         print(" ✓")
-        time.sleep(0.3)
 
     print(f"\n  ✓ Converted {len(pages_written)}/{len(pages)} pages")
 
@@ -726,19 +779,26 @@ Examples:
         action='store_true',
         help='Skip all prompts and use auto-detected/default values',
     )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        help='Worker processes for converting pages in directory mode (default: CPU count), '
+             'or concurrent page fetches in URL mode (default: 4)',
+    )
 
     args = parser.parse_args()
     interactive = not args.non_interactive
 
     # Detect input mode
     if os.path.isdir(args.source):
-        run_directory_migration(args.source, args.output, interactive, url=args.url)
+        run_directory_migration(args.source, args.output, interactive, url=args.url, jobs=args.jobs)
     elif args.source.startswith(('http://', 'https://')):
-        run_url_migration(args.source, args.output, interactive)
+        run_url_migration(args.source, args.output, interactive, jobs=args.jobs)
     else:
         # Could be a path that doesn't exist yet, or a malformed URL
         if os.path.exists(args.source):
-            run_directory_migration(args.source, args.output, interactive, url=args.url)
+            run_directory_migration(args.source, args.output, interactive, url=args.url, jobs=args.jobs)
         else:
             print(f"Error: '{args.source}' is not a valid URL or directory.")
             print("  URL mode: python migrate.py https://docs.example.com")
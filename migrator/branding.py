@@ -12,6 +12,20 @@ from bs4 import BeautifulSoup
 
 from .utils import ensure_dir
 
+# CSS custom properties that usually hold the brand color, most reliable first
+_CSS_COLOR_VAR_RES = tuple(re.compile(pattern) for pattern in (
+    r'--primary[^:]*:\s*(#[0-9a-fA-F]{3,8})',
+    r'--brand[^:]*:\s*(#[0-9a-fA-F]{3,8})',
+    r'--accent[^:]*:\s*(#[0-9a-fA-F]{3,8})',
+    r'--color-primary[^:]*:\s*(#[0-9a-fA-F]{3,8})',
+    r'--theme-color[^:]*:\s*(#[0-9a-fA-F]{3,8})',
+))
+_BACKGROUND_COLOR_RE = re.compile(r'background(?:-color)?:\s*(#[0-9a-fA-F]{3,8})')
+_FONT_FAMILY_PARAM_RE = re.compile(r'family=([^&:]+)')
+_FONT_IMPORT_RE = re.compile(r'@import\s+url\([\'"]?.*fonts\.googleapis\.com.*family=([^&\'")+]+)')
+_BODY_FONT_RE = re.compile(r'body\s*\{[^}]*font-family:\s*[\'"]?([^\'",;}{]+)')
+_HEX_COLOR_RE = re.compile(r'^#([0-9a-fA-F]{3}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})$')
+
 
 @dataclass
 class BrandAssets:
@@ -185,16 +199,8 @@ class BrandingExtractor:
     def _extract_primary_color(self, soup: BeautifulSoup, html: str) -> Optional[str]:
         """Extract the primary/brand color from CSS."""
         # Strategy 1: Look for CSS custom properties (most reliable)
-        color_patterns = [
-            r'--primary[^:]*:\s*(#[0-9a-fA-F]{3,8})',
-            r'--brand[^:]*:\s*(#[0-9a-fA-F]{3,8})',
-            r'--accent[^:]*:\s*(#[0-9a-fA-F]{3,8})',
-            r'--color-primary[^:]*:\s*(#[0-9a-fA-F]{3,8})',
-            r'--theme-color[^:]*:\s*(#[0-9a-fA-F]{3,8})',
-        ]
-
-        for pattern in color_patterns:
-            match = re.search(pattern, html)
+        for pattern in _CSS_COLOR_VAR_RES:
+            match = pattern.search(html)
             if match:
                 color = match.group(1)
                 if self._is_valid_hex(color):
@@ -211,7 +217,7 @@ class BrandingExtractor:
         # Extract from inline styles on header/nav elements
         for el in soup.find_all(['a', 'button', 'header'], limit=20):
             style = el.get('style', '')
-            bg_match = re.search(r'background(?:-color)?:\s*(#[0-9a-fA-F]{3,8})', style)
+            bg_match = _BACKGROUND_COLOR_RE.search(style)
             if bg_match:
                 color = bg_match.group(1)
                 if self._is_valid_hex(color) and not self._is_grayscale(color):
@@ -226,7 +232,7 @@ class BrandingExtractor:
             href = link['href']
             if 'fonts.googleapis.com' in href:
                 # Parse font family from URL
-                match = re.search(r'family=([^&:]+)', href)
+                match = _FONT_FAMILY_PARAM_RE.search(href)
                 if match:
                     font = match.group(1).replace('+', ' ')
                     return font.split('|')[0]  # First font if multiple
@@ -234,12 +240,12 @@ class BrandingExtractor:
         # Strategy 2: @import in style tags
         for style in soup.find_all('style'):
             text = style.get_text()
-            match = re.search(r'@import\s+url\([\'"]?.*fonts\.googleapis\.com.*family=([^&\'")+]+)', text)
+            match = _FONT_IMPORT_RE.search(text)
             if match:
                 return match.group(1).replace('+', ' ')
 
         # Strategy 3: CSS font-family on body
-        match = re.search(r'body\s*\{[^}]*font-family:\s*[\'"]?([^\'",;}{]+)', html)
+        match = _BODY_FONT_RE.search(html)
         if match:
             font = match.group(1).strip().strip('"\'')
             # Skip generic fonts
@@ -319,7 +325,7 @@ class BrandingExtractor:
     @staticmethod
     def _is_valid_hex(color: str) -> bool:
         """Check if a string is a valid hex color."""
-        return bool(re.match(r'^#([0-9a-fA-F]{3}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})$', color))
+        return bool(_HEX_COLOR_RE.match(color))
 
     @staticmethod
     def _is_grayscale(hex_color: str) -> bool:
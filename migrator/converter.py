@@ -19,6 +19,12 @@ HINT_MAP = {
     'note': 'Note',
 }
 
+# Leading emoji/punctuation GitBook prepends to hint content
+_HINT_PREFIX_RE = re.compile(r'^[^\w<*\[`#]*')
+# Anchor links GitBook adds inside headings
+_HEADING_ANCHOR_RE = re.compile(r'\[?\]?\(#.*?\)')
+_EXCESS_BLANK_LINES_RE = re.compile(r'\n{4,}')
+
 
 class GitBookConverter:
     """Converts GitBook HTML content to Mintlify-compatible MDX."""
@@ -209,7 +215,7 @@ class GitBookConverter:
         inner = self._convert_children(element).strip()
 
         # Remove any leading emoji that GitBook adds to hints
-        inner = re.sub(r'^[^\w<*\[`#]*', '', inner)
+        inner = _HINT_PREFIX_RE.sub('', inner)
 
         return f'\n<{component}>\n\n{inner}\n\n</{component}>\n\n'
 
@@ -218,7 +224,7 @@ class GitBookConverter:
         level = int(element.name[1])
         text = self._convert_children(element).strip()
         # Remove any anchor links GitBook adds inside headings
-        text = re.sub(r'\[?\]?\(#.*?\)', '', text).strip()
+        text = _HEADING_ANCHOR_RE.sub('', text).strip()
         prefix = '#' * level
         return f'\n{prefix} {text}\n\n'
 
@@ -511,7 +517,7 @@ class GitBookConverter:
     def _clean_output(self, text: str) -> str:
         """Clean up the final MDX output."""
         # Remove excessive blank lines (more than 2 consecutive)
-        text = re.sub(r'\n{4,}', '\n\n\n', text)
+        text = _EXCESS_BLANK_LINES_RE.sub('\n\n\n', text)
         # Remove trailing whitespace on lines
         text = '\n'.join(line.rstrip() for line in text.split('\n'))
         # Ensure file ends with single newline
@@ -47,10 +47,12 @@ class GitBookCrawler:
         # Try sitemap first for page discovery
         sitemap_urls = self._try_sitemap()
 
-        # Always parse navigation from the homepage for structure
+        # Always parse navigation from the homepage for structure.
+        # The homepage is parsed once and shared with the link-crawl fallback.
         homepage_html = self._fetch(self.base_url)
-        if homepage_html:
-            self.nav_tree = self._parse_navigation(homepage_html)
+        homepage_soup = BeautifulSoup(homepage_html, 'lxml') if homepage_html else None
+        if homepage_soup is not None:
+            self.nav_tree = self._parse_navigation(homepage_soup)
 
         if sitemap_urls:
             print(f"  Found {len(sitemap_urls)} pages via sitemap")
@@ -61,7 +63,7 @@ class GitBookCrawler:
         else:
             # Last resort: crawl links from homepage
             print(f"  Falling back to link crawling")
-            self._crawl_links(homepage_html)
+            self._crawl_links(homepage_soup)
 
         print(f"  Discovered {len(self.pages)} pages")
         return self.pages, self.nav_tree
@@ -95,9 +97,8 @@ class GitBookCrawler:
                     break
         return urls
 
-    def _parse_navigation(self, html: str) -> list[NavItem]:
+    def _parse_navigation(self, soup: BeautifulSoup) -> list[NavItem]:
         """Extract navigation structure from the sidebar."""
-        soup = BeautifulSoup(html, 'lxml')
         nav_tree = []
 
         # GitBook navigation selectors (try multiple patterns)
@@ -208,7 +209,20 @@ class GitBookCrawler:
 
     def _parse_nav_li(self, li) -> Optional[NavItem]:
         """Parse a single <li> navigation element."""
-        link = li.find('a', recursive=False)
+        # One pass over the direct children picks up both the direct link
+        # and the nested list (sub-pages)
+        link = None
+        sub_list = None
+        for child in li.children:
+            name = getattr(child, 'name', None)
+            if name == 'a' and link is None:
+                link = child
+            elif name in ('ul', 'ol') and sub_list is None:
+                sub_list = child
+            if link is not None and sub_list is not None:
+                break
+
+        # Link nested in a wrapper element — first <a> in document order
         if not link:
             link = li.find('a')
 
@@ -222,8 +236,7 @@ class GitBookCrawler:
 
         item = NavItem(title=title, path=path, url=url)
 
-        # Check for nested list (sub-pages)
-        sub_list = li.find(['ul', 'ol'], recursive=False)
+        # Nested list (sub-pages)
         if sub_list:
             for sub_li in sub_list.find_all('li', recursive=False):
                 child = self._parse_nav_li(sub_li)
@@ -235,18 +248,20 @@ class GitBookCrawler:
     def _build_pages_from_sitemap(self, urls: list[str]):
         """Create PageInfo objects from sitemap URLs."""
         base_netloc = urlparse(self.base_url).netloc
-        for i, url in enumerate(urls):
-            parsed = urlparse(url)
-            if parsed.netloc != base_netloc:
-                continue
-            path = url_to_filepath(url, self.base_url)
-            title = path.split('/')[-1].replace('-', ' ').title() if path else 'Home'
-            self.pages.append(PageInfo(
+        entries = [
+            (i, url, url_to_filepath(url, self.base_url))
+            for i, url in enumerate(urls)
+            if urlparse(url).netloc == base_netloc
+        ]
+        self.pages.extend(
+            PageInfo(
                 url=url,
-                title=title,
+                title=_title_from_path(path) if path else 'Home',
                 path=path or 'index',
                 order=i,
-            ))
+            )
+            for i, url, path in entries
+        )
 
     def _build_pages_from_nav(self, nav_items: list[NavItem], order_start: int = 0):
         """Create PageInfo objects from navigation tree."""
@@ -272,13 +287,13 @@ class GitBookCrawler:
                 if child.children:
                     self._build_pages_from_nav(child.children, order)
 
-    def _crawl_links(self, html: Optional[str]):
+    def _crawl_links(self, soup: Optional[BeautifulSoup]):
         """Fallback: discover pages by crawling links from homepage."""
-        if not html:
+        if soup is None:
             return
-        soup = BeautifulSoup(html, 'lxml')
         base_netloc = urlparse(self.base_url).netloc
         seen = set()
+        links = []
 
         for a in soup.find_all('a', href=True):
             href = a['href']
@@ -296,12 +311,18 @@ class GitBookCrawler:
 
             seen.add(url)
             path = url_to_filepath(url, self.base_url)
-            title = a.get_text(strip=True) or path.split('/')[-1].replace('-', ' ').title()
+            title = a.get_text(strip=True) or _title_from_path(path)
 
             if path and title:
-                self.pages.append(PageInfo(
-                    url=url,
-                    title=title,
-                    path=path,
-                    order=len(self.pages),
-                ))
+                links.append((url, title, path))
+
+        order_start = len(self.pages)
+        self.pages.extend(
+            PageInfo(url=url, title=title, path=path, order=order_start + i)
+            for i, (url, title, path) in enumerate(links)
+        )
+
+
+def _title_from_path(path: str) -> str:
+    """Derive a display title from the last segment of a page path."""
+    return path.split('/')[-1].replace('-', ' ').title()
@@ -4,11 +4,15 @@ GitBook uses {% %} template tags for custom components. This module
 converts those to Mintlify MDX components while preserving standard markdown.
 """
 
+import bisect
+import functools
+import os
+import posixpath
 import re
 from typing import Optional
 
 from .icons import validate_icon
-from .utils import sanitize_filename
+from .utils import clean_asset_filename, sanitize_filename
 
 
 # GitBook hint styles → Mintlify callout components
@@ -20,6 +24,118 @@ HINT_MAP = {
     'danger': 'Warning',
 }
 
+# ---- Compiled patterns ----
+
+# Frontmatter / headings
+_H1_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+
+# GitBook template tags. Opening tags are fused into one alternation with a
+# named group per tag type; block tags are closed by the matching entry in
+# _TEMPLATE_CLOSE_RES (see MarkdownConverter._convert_templates).
+_TEMPLATE_OPEN_RE = re.compile('|'.join([
+    r'(?P<hint>\{%\s*hint\s+[^%]*?(?:style="(?P<hint_style>\w+)"[^%]*?)?%\})',
+    r'(?P<tabs>\{%\s*tabs\s*%\})',
+    r'(?P<expand>\{%\s*expand\s+title="(?P<expand_title>[^"]+)"\s*%\})',
+    r'(?P<details><details>\s*<summary>(?P<details_summary>[^<]+)</summary>)',
+    r'(?P<code>\{%\s*code(?P<code_attrs>[^%]*?)%\})',
+    r'(?P<content_ref>\{%\s*content-ref\s+url="(?P<content_ref_url>[^"]+)"\s*%\})',
+    r'(?P<embed>\{%\s*embed\s+url="(?P<embed_url>[^"]+)"[^%]*%\})',
+    r'(?P<swagger>\{% \s*swagger[^%]*%\})',
+    r'(?P<api_method>\{% \s*api-method[^%]*%\})',
+    r'(?P<file>\{%\s*file\s+src="(?P<file_src>[^"]+)"[^%]*%\})',
+    r'(?P<stepper>\{%\s*stepper\s*%\})',
+]))
+_TEMPLATE_CLOSE_RES = {
+    'hint': re.compile(r'\{%\s*endhint\s*%\}'),
+    'tabs': re.compile(r'\{%\s*endtabs\s*%\}'),
+    'expand': re.compile(r'\{%\s*endexpand\s*%\}'),
+    'details': re.compile(r'</details>'),
+    'code': re.compile(r'\{%\s*endcode\s*%\}'),
+    'content_ref': re.compile(r'\{%\s*endcontent-ref\s*%\}'),
+    'swagger': re.compile(r'\{% \s*endswagger\s*%\}'),
+    'api_method': re.compile(r'\{% \s*endapi-method\s*%\}'),
+    'stepper': re.compile(r'\{%\s*endstepper\s*%\}'),
+}
+_TAB_RE = re.compile(r'\{%\s*tab\s+title="([^"]+)"\s*%\}(.*?)\{%\s*endtab\s*%\}', re.DOTALL)
+_STEP_RE = re.compile(r'\{%\s*step\s*%\}(.*?)(?=\{%\s*(?:step|endstepper)\s*%\})', re.DOTALL)
+_STEP_TITLE_RE = re.compile(r'^#{1,6}\s+(.+)$', re.MULTILINE)
+_INCLUDE_RE = re.compile(r'\{%\s*include\s+"([^"]+)"\s*%\}')
+_INCLUDE_PATH_RE = re.compile(r'\.gitbook/includes/(.+)')
+# Leftover tag: a bare end tag, or any other tag with its (optional) name captured
+_LEFTOVER_TAG_RE = re.compile(r'\{%\s*(?:end\w+\s*%\}|(\w+)?[^%]*%\})')
+
+# Tag attributes
+_TITLE_ATTR_RE = re.compile(r'title="([^"]+)"')
+_LANG_ATTR_RE = re.compile(r'lang(?:uage)?="([^"]+)"')
+_METHOD_ATTR_RE = re.compile(r'method="(\w+)"')
+_PATH_ATTR_RE = re.compile(r'path="([^"]+)"')
+_CAPTION_ATTR_RE = re.compile(r'caption="([^"]+)"')
+_DATA_TITLE_ATTR_RE = re.compile(r'data-title="([^"]+)"')
+_ALT_ATTR_RE = re.compile(r'alt="([^"]*)"')
+_SRC_ATTR_RE = re.compile(r'src="([^"]*)"')
+_CODE_LANG_ATTR_RE = re.compile(r'(?:class="lang(?:uage)?-(\w+)"|data-lang="(\w+)")')
+
+# HTML blocks
+_PRE_CODE_RE = re.compile(
+    r'<pre[^>]*?((?:class|data-)[^>]*)?>\s*<code[^>]*?((?:class|data-)[^>]*)?>(.*?)</code>\s*</pre>',
+    re.DOTALL,
+)
+_STRONG_TAG_RE = re.compile(r'</?strong>')
+_INLINE_TAG_RE = re.compile(r'</?(?:em|mark|span)[^>]*>')
+_CARD_TABLE_RE = re.compile(r'<table[^>]*data-view="cards"[^>]*>.*?</table>', re.DOTALL)
+_TH_RE = re.compile(r'<th\b([^>]*)>')
+_TBODY_RE = re.compile(r'<tbody>(.*?)</tbody>', re.DOTALL)
+_TR_RE = re.compile(r'<tr>(.*?)</tr>', re.DOTALL)
+_TD_RE = re.compile(r'<td[^>]*>(.*?)</td>', re.DOTALL)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_A_HREF_RE = re.compile(r'<a\s+href="([^"]+)"')
+
+# Images and links
+_ASSET_PATH_RE = re.compile(r'\.gitbook/assets/(.+)')
+# Markdown image (alt, src) or a whole <img> tag, capturing its first
+# .gitbook/assets src (group 3) when it has one
+_IMAGE_RE = re.compile(
+    r'!\[([^\]]*)\]\(([^)]+)\)'
+    r'|<img\s(?:[^>]*?src="([^">]*\.gitbook/assets/[^">]*)")?[^>]*>'
+)
+_IMG_SRC_TAG_RE = re.compile(r'<img\s[^>]*src="([^"]*)"[^>]*>')
+_IMG_ATTRS_RE = re.compile(r'<img\s([^>]*)>')
+_SELF_CLOSED_IMG_RE = re.compile(r'<img\s[^>]*/\s*>')
+# The not-an-image lookbehind sits after the literal [ so the engine can
+# jump between [ characters instead of trying every position
+_MD_LINK_RE = re.compile(r'\[(?<!!\[)([^\]]+)\]\(([^)]+)\)')
+_LINK_TEXT_RE = re.compile(r'\[([^\]]+)\]')
+_LINK_TITLE_RE = re.compile(r'^(.+?)\s+"[^"]*"\s*$')
+
+# Output cleanup
+_HEADING_ANCHOR_TAG_RE = re.compile(
+    r'\s*<a\s+(?:href="#[^"]*"\s+id="[^"]*"|id="[^"]*"\s+href="#[^"]*")\s*>\s*</a>'
+)
+_HEADING_ANCHOR_LINK_RE = re.compile(r'(^#{1,6}\s+.*?)\s*\[(?:[^\]]*)\]\(#[^)]*\)\s*$', re.MULTILINE)
+_EMPTY_P_RE = re.compile(r'<p>\s*</p>')
+_EMPTY_STRONG_RE = re.compile(r'<strong>\s*</strong>')
+_EMPTY_EM_RE = re.compile(r'<em>\s*</em>')
+_FIGURE_RE = re.compile(r'<figure>.*?</figure>', re.DOTALL)
+_FIGCAPTION_RE = re.compile(r'<figcaption>(.*?)</figcaption>', re.DOTALL)
+_PICTURE_RE = re.compile(r'<picture>.*?</picture>', re.DOTALL)
+_OPEN_IMG_RE = re.compile(r'<img\s([^>]*?)>')
+_BR_HR_RE = re.compile(r'<(br|hr)\s*/?>')
+_DOUBLE_SELF_CLOSE_RE = re.compile(r'/\s+/>')
+_MARK_RE = re.compile(r'<mark[^>]*>(.*?)</mark>', re.DOTALL)
+_INLINE_IMG_BOTH_RE = re.compile(r'&#x20;\s*\n\s*\n\s*(<img\s[^>]*/\s*>)\s*\n\s*\n\s*&#x20;')
+_INLINE_IMG_BEFORE_RE = re.compile(r'&#x20;\s*\n\s*\n\s*(<img\s[^>]*/\s*>)\s*\n')
+_INLINE_IMG_AFTER_RE = re.compile(r'\n\s*(<img\s[^>]*/\s*>)\s*\n\s*\n\s*&#x20;')
+_LIST_IMG_RE = re.compile(r'(\S[^\n]*)\n\n(\s+)(<img\s[^>]*/\s*>)\n\n\2([a-z][^\n]*)')
+_EXCESS_BLANK_LINES_RE = re.compile(r'\n{4,}')
+_INLINE_CODE_SPLIT_RE = re.compile(r'(`[^`]*`)')
+_JSX_COMMENT_SPLIT_RE = re.compile(r'(\{/\*.*?\*/\})')
+# Fenced block with an info string (group 1), up to the first bare ``` line
+_CODE_BLOCK_RE = re.compile(
+    r'^[^\S\n]*```([^\S\n]*\S[^\n]*)\n(?:[^\n]*\n)*?[^\S\n]*```[^\S\n]*$', re.MULTILINE
+)
+_ACCORDION_TAG_RE = re.compile(r'<Accordion\b[^>]*>|</Accordion>')
+_WHITESPACE_RUN_RE = re.compile(r'\s*')
+
 
 class MarkdownConverter:
     """Converts GitBook-flavored Markdown to Mintlify MDX."""
@@ -44,7 +160,6 @@ class MarkdownConverter:
         self.qa_issues = []
         self.page_hidden = False
         # Store current page's directory for resolving relative links
-        import os
         self._current_page_dir = os.path.dirname(page_path) if page_path else ''
 
         # Extract existing frontmatter if present
@@ -62,34 +177,35 @@ class MarkdownConverter:
         self.page_hidden = hidden
         noindex = existing_fm.get('noIndex', '').lower() == 'true'
 
+        # Each pass below is skipped when a substring its patterns require is
+        # absent — most pages are plain markdown with few or no GitBook tags.
+
         # Resolve {% include %} tags by inlining included file content
-        body = self._resolve_includes(body)
+        if '{%' in body:
+            body = self._resolve_includes(body)
 
         # Convert GitBook template tags to Mintlify components
-        body = self._convert_hints(body)
-        body = self._convert_tabs(body)
-        body = self._convert_expandable(body)
-        body = self._convert_code_blocks(body)
-        body = self._convert_content_refs(body)
-        body = self._convert_embeds(body)
-        body = self._convert_swagger(body)
-        body = self._convert_file_refs(body)
-        body = self._convert_stepper(body)
+        body = self._convert_templates(body)
 
         # Convert GitBook card tables to Mintlify CardGroup/Card
-        body = self._convert_card_tables(body)
+        if 'data-view="cards"' in body:
+            body = self._convert_card_tables(body)
 
         # Clean up any remaining template tags
-        body = self._cleanup_template_tags(body)
+        if '{%' in body:
+            body = self._cleanup_template_tags(body)
 
         # Convert <pre><code> HTML blocks to fenced code blocks
-        body = self._convert_pre_code_blocks(body)
+        if '<pre' in body:
+            body = self._convert_pre_code_blocks(body)
 
         # Convert image references
-        body = self._convert_images(body)
+        if '.gitbook/assets/' in body:
+            body = self._convert_images(body)
 
         # Convert internal links (.md → relative paths)
-        body = self._convert_links(body)
+        if '](' in body:
+            body = self._convert_links(body)
 
         # Remove the first H1 if it matches the title (Mintlify shows title from frontmatter)
         body = self._remove_duplicate_title(body, title)
@@ -105,21 +221,16 @@ class MarkdownConverter:
 
     def _split_frontmatter(self, content: str) -> tuple[dict, str]:
         """Split YAML frontmatter from body content."""
-        if not content.startswith('---'):
+        fm_text, body = _partition_frontmatter(content)
+        if fm_text is None:
             return {}, content
 
-        parts = content.split('---', 2)
-        if len(parts) < 3:
-            return {}, content
-
-        fm_text = parts[1].strip()
-        body = parts[2]
-
         # Simple YAML parsing for key: value pairs (handles block scalars)
         fm = {}
-        lines = fm_text.split('\n')
+        lines = fm_text.strip().split('\n')
+        n = len(lines)
         i = 0
-        while i < len(lines):
+        while i < n:
             line = lines[i]
             if ':' in line and not line.startswith(' '):
                 key, _, value = line.partition(':')
@@ -129,7 +240,7 @@ class MarkdownConverter:
                     # Collect indented continuation lines
                     block_lines = []
                     i += 1
-                    while i < len(lines) and (lines[i].startswith('  ') or lines[i].strip() == ''):
+                    while i < n and (lines[i].startswith('  ') or lines[i].strip() == ''):
                         block_lines.append(lines[i].strip())
                         i += 1
                     fm[key.strip()] = ' '.join(bl for bl in block_lines if bl)
@@ -142,16 +253,15 @@ class MarkdownConverter:
 
     def _extract_h1(self, content: str) -> str:
         """Extract the first H1 heading from content."""
-        match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+        match = _H1_RE.search(content)
         return match.group(1).strip() if match else ''
 
     def _remove_duplicate_title(self, body: str, title: str) -> str:
         """Remove the first H1 if it duplicates the frontmatter title."""
-        if not title:
+        # The heading has to contain the title verbatim
+        if not title or title not in body:
             return body
-        pattern = rf'^\s*#\s+{re.escape(title)}\s*$'
-        body = re.sub(pattern, '', body, count=1, flags=re.MULTILINE)
-        return body
+        return _duplicate_title_re(title).sub('', body, count=1)
 
     def _build_frontmatter(self, title: str, description: str, icon: str = '',
                            sidebar_title: str = '', hidden: bool = False,
@@ -195,508 +305,467 @@ class MarkdownConverter:
 
     # ---- GitBook Template Tag Converters ----
 
-    def _convert_hints(self, content: str) -> str:
-        """Convert {% hint style="..." %} to Mintlify callouts."""
-        def replace_hint(match):
-            attrs = match.group(1)
-            inner = match.group(2).strip()
+    def _convert_templates(self, content: str) -> str:
+        """Convert GitBook template tags to Mintlify components in one pass.
 
-            # Extract style
-            style_match = re.search(r'style="(\w+)"', attrs)
-            style = style_match.group(1) if style_match else 'info'
-            component = HINT_MAP.get(style, 'Note')
+        Walks opening tags left to right and pairs each block tag with the
+        first closing tag of its type. Tag bodies are converted recursively,
+        so components nested inside hints, tabs, accordions, code blocks and
+        steps are handled too.
+        """
+        # Plain text — the common case for component bodies — has no tags
+        if '{%' not in content and '<details>' not in content:
+            return content
+
+        parts = []
+        pos = 0
+        search_from = 0
+        # Tag type → first closing tag at/after the last lookup (None: no more)
+        closes = {}
+        while True:
+            match = _TEMPLATE_OPEN_RE.search(content, search_from)
+            if not match:
+                break
+            kind = match.lastgroup
+            close_re = _TEMPLATE_CLOSE_RES.get(kind)
+            if close_re is None:
+                # Self-contained tag (embed, file)
+                body = ''
+                end = match.end()
+            else:
+                close = closes.get(kind)
+                if kind not in closes or (close is not None and close.start() < match.end()):
+                    close = closes[kind] = close_re.search(content, match.end())
+                if close is None:
+                    # Unclosed block — leave the tag for _cleanup_template_tags
+                    search_from = match.start() + 1
+                    continue
+                body = content[match.end():close.start()]
+                end = close.end()
+            parts.append(content[pos:match.start()])
+            parts.append(self._TEMPLATE_HANDLERS[kind](self, match, body))
+            pos = search_from = end
+
+        if not parts:
+            return content
+        parts.append(content[pos:])
+        return ''.join(parts)
+
+    def _replace_hint(self, match, body: str) -> str:
+        """Convert {% hint style="..." %} to Mintlify callouts."""
+        inner = self._convert_templates(body).strip()
 
-            return f'\n<{component}>\n\n{inner}\n\n</{component}>\n'
+        # The style attribute is captured by _TEMPLATE_OPEN_RE
+        style = match.group('hint_style') or 'info'
+        component = HINT_MAP.get(style, 'Note')
 
-        # Match {% hint ... %} with any combination of attributes
-        pattern = r'\{%\s*hint\s+([^%]*?)%\}(.*?)\{%\s*endhint\s*%\}'
-        return re.sub(pattern, replace_hint, content, flags=re.DOTALL)
+        return f'\n<{component}>\n\n{inner}\n\n</{component}>\n'
 
-    def _convert_tabs(self, content: str) -> str:
+    def _replace_tabs(self, match, body: str) -> str:
         """Convert {% tabs %}/{% tab %} to Mintlify Tabs."""
-        def replace_tabs(match):
-            tabs_content = match.group(1)
-
-            # Extract individual tabs
-            tab_pattern = r'\{%\s*tab\s+title="([^"]+)"\s*%\}(.*?)\{%\s*endtab\s*%\}'
-            tabs = re.findall(tab_pattern, tabs_content, flags=re.DOTALL)
-
-            if not tabs:
-                return tabs_content
-
-            parts = ['\n<Tabs>\n']
-            for title, body in tabs:
-                body = body.strip()
-                parts.append(f'\n<Tab title="{title}">\n\n{body}\n\n</Tab>\n')
-            parts.append('\n</Tabs>\n')
-            return ''.join(parts)
-
-        pattern = r'\{%\s*tabs\s*%\}(.*?)\{%\s*endtabs\s*%\}'
-        return re.sub(pattern, replace_tabs, content, flags=re.DOTALL)
-
-    def _convert_expandable(self, content: str) -> str:
-        """Convert {% expand %} / <details> to Mintlify Accordion."""
-        # GitBook expand syntax
-        def replace_expand(match):
-            title = match.group(1)
-            inner = match.group(2).strip()
-            return f'\n<Accordion title="{self._escape_yaml(title)}">\n\n{inner}\n\n</Accordion>\n'
-
-        # {% expand title="..." %} syntax
-        pattern = r'\{%\s*expand\s+title="([^"]+)"\s*%\}(.*?)\{%\s*endexpand\s*%\}'
-        content = re.sub(pattern, replace_expand, content, flags=re.DOTALL)
-
-        # Also handle HTML <details>/<summary> in markdown
-        def replace_details(match):
-            summary = match.group(1)
-            inner = match.group(2).strip()
-            return f'\n<Accordion title="{self._escape_yaml(summary)}">\n\n{inner}\n\n</Accordion>\n'
-
-        pattern = r'<details>\s*<summary>([^<]+)</summary>(.*?)</details>'
-        content = re.sub(pattern, replace_details, content, flags=re.DOTALL)
-
-        return content
-
-    def _convert_code_blocks(self, content: str) -> str:
-        """Convert GitBook {% code %} blocks to fenced code blocks."""
-        def replace_code(match):
-            attrs = match.group(1)
-            inner = match.group(2).strip()
-
-            title = ''
-            title_match = re.search(r'title="([^"]+)"', attrs)
-            if title_match:
-                title = title_match.group(1)
-
-            lang = ''
-            lang_match = re.search(r'lang(?:uage)?="([^"]+)"', attrs)
-            if lang_match:
-                lang = lang_match.group(1)
-
-            # If inner already has a fenced code block, just add the title
-            if inner.startswith('```'):
-                if title and '\n' in inner:
-                    # Insert title after the opening ```lang
-                    first_line_end = inner.index('\n')
-                    first_line = inner[:first_line_end]
-                    rest = inner[first_line_end:]
-                    return f'{first_line} {title}{rest}'
-                return inner
-
-            return f'```{lang} {title}\n{inner}\n```'
-
-        pattern = r'\{%\s*code([^%]*?)%\}(.*?)\{%\s*endcode\s*%\}'
-        return re.sub(pattern, replace_code, content, flags=re.DOTALL)
-
-    def _convert_content_refs(self, content: str) -> str:
-        """Convert {% content-ref %} to Mintlify card links."""
-        def replace_ref(match):
-            url = match.group(1)
-            inner = match.group(2).strip()
+        # Convert individual tabs as they are matched
+        tab_blocks = ''.join(
+            f'\n<Tab title="{m.group(1)}">\n\n{self._convert_templates(m.group(2)).strip()}\n\n</Tab>\n'
+            for m in _TAB_RE.finditer(body)
+        )
 
-            # Convert .md path to Mintlify path
-            clean_url = self._convert_md_path(url)
+        if not tab_blocks:
+            return self._convert_templates(body)
 
-            # Extract link text from inner content
-            link_match = re.search(r'\[([^\]]+)\]', inner)
-            title = link_match.group(1) if link_match else clean_url
+        return f'\n<Tabs>\n{tab_blocks}\n</Tabs>\n'
 
-            return f'\n<Card title="{self._escape_yaml(title)}" href="/{clean_url}">\n\n</Card>\n'
+    def _replace_expand(self, match, body: str) -> str:
+        """Convert {% expand title="..." %} to Mintlify Accordion."""
+        title = match.group('expand_title')
+        inner = self._convert_templates(body).strip()
+        return f'\n<Accordion title="{self._escape_yaml(title)}">\n\n{inner}\n\n</Accordion>\n'
 
-        pattern = r'\{%\s*content-ref\s+url="([^"]+)"\s*%\}(.*?)\{%\s*endcontent-ref\s*%\}'
-        return re.sub(pattern, replace_ref, content, flags=re.DOTALL)
+    def _replace_details(self, match, body: str) -> str:
+        """Convert HTML <details>/<summary> in markdown to Mintlify Accordion."""
+        summary = match.group('details_summary')
+        inner = self._convert_templates(body).strip()
+        return f'\n<Accordion title="{self._escape_yaml(summary)}">\n\n{inner}\n\n</Accordion>\n'
 
-    def _convert_embeds(self, content: str) -> str:
-        """Convert {% embed %} to links or frames."""
-        def replace_embed(match):
-            url = match.group(1)
-            self.qa_issues.append(f'Embedded content: {url} — verify rendering')
+    def _replace_code(self, match, body: str) -> str:
+        """Convert GitBook {% code %} blocks to fenced code blocks."""
+        attrs = match.group('code_attrs')
+        inner = self._convert_templates(body).strip()
+
+        title = ''
+        title_match = _TITLE_ATTR_RE.search(attrs)
+        if title_match:
+            title = title_match.group(1)
+
+        lang = ''
+        lang_match = _LANG_ATTR_RE.search(attrs)
+        if lang_match:
+            lang = lang_match.group(1)
+
+        # If inner already has a fenced code block, just add the title
+        if inner.startswith('```'):
+            if title and '\n' in inner:
+                # Insert title after the opening ```lang
+                first_line_end = inner.index('\n')
+                first_line = inner[:first_line_end]
+                rest = inner[first_line_end:]
+                return f'{first_line} {title}{rest}'
+            return inner
+
+        return f'```{lang} {title}\n{inner}\n```'
+
+    def _replace_content_ref(self, match, body: str) -> str:
+        """Convert {% content-ref %} to Mintlify card links."""
+        url = match.group('content_ref_url')
+        inner = body.strip()
 
-            # YouTube/Vimeo → iframe
-            if 'youtube.com' in url or 'youtu.be' in url or 'vimeo.com' in url:
-                return f'\n<Frame>\n  <iframe src="{url}" />\n</Frame>\n'
+        # Convert .md path to Mintlify path
+        clean_url = self._convert_md_path(url)
 
-            return f'\n[Embedded: {url}]({url})\n'
+        # Extract link text from inner content
+        link_match = _LINK_TEXT_RE.search(inner)
+        title = link_match.group(1) if link_match else clean_url
 
-        pattern = r'\{%\s*embed\s+url="([^"]+)"[^%]*%\}'
-        return re.sub(pattern, replace_embed, content)
+        return f'\n<Card title="{self._escape_yaml(title)}" href="/{clean_url}">\n\n</Card>\n'
 
-    def _convert_swagger(self, content: str) -> str:
-        """Flag {% swagger %} / {% api-method %} blocks for manual review."""
-        def replace_swagger(match):
-            inner = match.group(1)
+    def _replace_embed(self, match, body: str) -> str:
+        """Convert {% embed %} to links or frames."""
+        url = match.group('embed_url')
+        self.qa_issues.append(f'Embedded content: {url} — verify rendering')
 
-            # Try to extract method and path
-            method_match = re.search(r'method="(\w+)"', inner)
-            path_match = re.search(r'path="([^"]+)"', inner)
+        # YouTube/Vimeo → iframe
+        if 'youtube.com' in url or 'youtu.be' in url or 'vimeo.com' in url:
+            return f'\n<Frame>\n  <iframe src="{url}" />\n</Frame>\n'
 
-            method = method_match.group(1).upper() if method_match else ''
-            path = path_match.group(1) if path_match else ''
+        return f'\n[Embedded: {url}]({url})\n'
 
-            self.qa_issues.append(f'API reference: {method} {path} — convert to OpenAPI spec')
+    def _replace_swagger(self, match, body: str) -> str:
+        """Flag {% swagger %} / {% api-method %} blocks for manual review."""
+        # Try to extract method and path
+        method_match = _METHOD_ATTR_RE.search(body)
+        path_match = _PATH_ATTR_RE.search(body)
 
-            return f'\n{{/* API Reference: {method} {path} — flagged for manual review. Use Mintlify OpenAPI integration instead. */}}\n'
+        method = method_match.group(1).upper() if method_match else ''
+        path = path_match.group(1) if path_match else ''
 
-        # Handle both {% swagger %} and {% api-method %} syntaxes
-        for tag in ['swagger', 'api-method']:
-            pattern = rf'\{{% \s*{tag}[^%]*%\}}(.*?)\{{% \s*end{tag}\s*%\}}'
-            content = re.sub(pattern, replace_swagger, content, flags=re.DOTALL)
+        self.qa_issues.append(f'API reference: {method} {path} — convert to OpenAPI spec')
 
-        return content
+        return f'\n{{/* API Reference: {method} {path} — flagged for manual review. Use Mintlify OpenAPI integration instead. */}}\n'
 
-    def _convert_file_refs(self, content: str) -> str:
+    def _replace_file(self, match, body: str) -> str:
         """Convert {% file src="..." %} to download links."""
-        def replace_file(match):
-            src = match.group(1)
-            caption = ''
-            caption_match = re.search(r'caption="([^"]+)"', match.group(0))
-            if caption_match:
-                caption = caption_match.group(1)
-            label = caption or src.split('/')[-1]
-            return f'[{label}]({src})'
-
-        pattern = r'\{%\s*file\s+src="([^"]+)"[^%]*%\}'
-        return re.sub(pattern, replace_file, content)
-
-    def _convert_stepper(self, content: str) -> str:
+        src = match.group('file_src')
+        caption = ''
+        caption_match = _CAPTION_ATTR_RE.search(match.group(0))
+        if caption_match:
+            caption = caption_match.group(1)
+        label = caption or src.split('/')[-1]
+        return f'[{label}]({src})'
+
+    def _replace_stepper(self, match, body: str) -> str:
         """Convert {% stepper %}/{% step %} to Mintlify Steps."""
-        def replace_stepper(match):
-            stepper_content = match.group(1)
-
-            # Extract individual steps
-            step_pattern = r'\{%\s*step\s*%\}(.*?)(?=\{%\s*(?:step|endstepper)\s*%\})'
-            steps = re.findall(step_pattern, stepper_content, flags=re.DOTALL)
-
-            if not steps:
-                return stepper_content
-
-            parts = ['\n<Steps>\n']
-            for i, step_body in enumerate(steps):
-                step_body = step_body.strip()
-                # Try to extract a title from the first heading or bold text
-                title_match = re.match(r'^#{1,6}\s+(.+)$', step_body, re.MULTILINE)
-                if title_match:
-                    title = title_match.group(1)
-                    step_body = step_body[title_match.end():].strip()
-                else:
-                    title = f'Step {i + 1}'
-
-                parts.append(f'\n<Step title="{self._escape_yaml(title)}">\n\n{step_body}\n\n</Step>\n')
-            parts.append('\n</Steps>\n')
-            return ''.join(parts)
-
-        pattern = r'\{%\s*stepper\s*%\}(.*?)\{%\s*endstepper\s*%\}'
-        return re.sub(pattern, replace_stepper, content, flags=re.DOTALL)
+        # Convert individual steps as they are matched
+        step_blocks = ''.join(
+            self._step_block(i, m.group(1)) for i, m in enumerate(_STEP_RE.finditer(body))
+        )
+
+        if not step_blocks:
+            return self._convert_templates(body)
+
+        return f'\n<Steps>\n{step_blocks}\n</Steps>\n'
+
+    def _step_block(self, index: int, step_body: str) -> str:
+        """Convert the body of a single {% step %} to a Mintlify Step."""
+        step_body = self._convert_templates(step_body).strip()
+        # Try to extract a title from the first heading or bold text
+        title_match = _STEP_TITLE_RE.match(step_body)
+        if title_match:
+            title = title_match.group(1)
+            step_body = step_body[title_match.end():].strip()
+        else:
+            title = f'Step {index + 1}'
+        return f'\n<Step title="{self._escape_yaml(title)}">\n\n{step_body}\n\n</Step>\n'
+
+    # Template tag group name (see _TEMPLATE_OPEN_RE) → converter
+    _TEMPLATE_HANDLERS = {
+        'hint': _replace_hint,
+        'tabs': _replace_tabs,
+        'expand': _replace_expand,
+        'details': _replace_details,
+        'code': _replace_code,
+        'content_ref': _replace_content_ref,
+        'embed': _replace_embed,
+        'swagger': _replace_swagger,
+        'api_method': _replace_swagger,
+        'file': _replace_file,
+        'stepper': _replace_stepper,
+    }
 
     def _resolve_includes(self, content: str) -> str:
         """Resolve {% include %} tags by inlining the referenced file content."""
-        import os
-
-        def replace_include(match):
-            include_path = match.group(1)
-            # Resolve the .gitbook/includes/ path
-            gitbook_match = re.search(r'\.gitbook/includes/(.+)', include_path)
-            if gitbook_match and self.base_path:
-                full_path = os.path.join(self.base_path, '.gitbook', 'includes', gitbook_match.group(1))
-                if os.path.isfile(full_path):
-                    with open(full_path, 'r', encoding='utf-8', errors='replace') as f:
-                        included = f.read()
-                    # Strip frontmatter from included file
-                    _, included_body = self._split_frontmatter(included)
-                    return included_body.strip()
-            self.qa_issues.append(f'Could not resolve include: {include_path}')
-            return ''
-
-        pattern = r'\{%\s*include\s+"([^"]+)"\s*%\}'
-        return re.sub(pattern, replace_include, content)
+        return _INCLUDE_RE.sub(self._replace_include, content)
+
+    def _replace_include(self, match) -> str:
+        """Inline one {% include %} tag."""
+        include_path = match.group(1)
+        # Resolve the .gitbook/includes/ path
+        gitbook_match = _INCLUDE_PATH_RE.search(include_path)
+        if gitbook_match and self.base_path:
+            full_path = os.path.join(self.base_path, '.gitbook', 'includes', gitbook_match.group(1))
+            included_body = _read_include(full_path)
+            if included_body is not None:
+                return included_body
+        self.qa_issues.append(f'Could not resolve include: {include_path}')
+        return ''
 
     def _convert_pre_code_blocks(self, content: str) -> str:
         """Convert <pre><code> HTML blocks to fenced code blocks."""
-        def replace_pre_code(match):
-            pre_attrs = match.group(1) or ''
-            code_attrs = match.group(2) or ''
-            inner = match.group(3)
-
-            # Extract language from class
-            lang = ''
-            lang_match = re.search(r'(?:class="lang(?:uage)?-(\w+)"|data-lang="(\w+)")', pre_attrs + ' ' + code_attrs)
-            if lang_match:
-                lang = lang_match.group(1) or lang_match.group(2) or ''
-
-            # Extract title from data-title
-            title = ''
-            title_match = re.search(r'data-title="([^"]+)"', pre_attrs)
-            if title_match:
-                title = title_match.group(1)
+        return _PRE_CODE_RE.sub(self._replace_pre_code, content)
+
+    def _replace_pre_code(self, match) -> str:
+        """Convert one <pre><code> block to a fenced code block."""
+        pre_attrs = match.group(1) or ''
+        code_attrs = match.group(2) or ''
+        inner = match.group(3)
+
+        # Extract language from class
+        lang = ''
+        lang_match = _CODE_LANG_ATTR_RE.search(pre_attrs + ' ' + code_attrs)
+        if lang_match:
+            lang = lang_match.group(1) or lang_match.group(2) or ''
+
+        # Extract title from data-title
+        title = ''
+        title_match = _DATA_TITLE_ATTR_RE.search(pre_attrs)
+        if title_match:
+            title = title_match.group(1)
+
+        # Strip <strong> tags (GitBook line highlighting)
+        inner = _STRONG_TAG_RE.sub('', inner)
+        # Strip any other inline HTML
+        inner = _INLINE_TAG_RE.sub('', inner)
+
+        header = f'```{lang}'
+        if title:
+            header += f' {title}'
+        return f'\n{header}\n{inner}\n```\n'
 
-            # Strip <strong> tags (GitBook line highlighting)
-            inner = re.sub(r'</?strong>', '', inner)
-            # Strip any other inline HTML
-            inner = re.sub(r'</?(?:em|mark|span)[^>]*>', '', inner)
+    def _convert_card_tables(self, content: str) -> str:
+        """Convert GitBook <table data-view="cards"> to Mintlify CardGroup/Card."""
+        return _CARD_TABLE_RE.sub(self._replace_card_table, content)
+
+    def _replace_card_table(self, match) -> str:
+        """Convert one card-view table to a CardGroup."""
+        table_html = match.group(0)
+
+        # Parse column types from <thead> <th> attributes
+        col_types = []  # 'title', 'description', 'target', 'cover', 'hidden'
+        for th_match in _TH_RE.finditer(table_html):
+            attrs = th_match.group(1)
+            if 'data-card-target' in attrs:
+                col_types.append('target')
+            elif 'data-card-cover' in attrs and 'data-card-cover-dark' not in attrs:
+                col_types.append('cover')
+            elif 'data-hidden' in attrs:
+                col_types.append('hidden')
+            elif not col_types:
+                col_types.append('title')
+            else:
+                col_types.append('description')
 
-            header = f'```{lang}'
-            if title:
-                header += f' {title}'
-            return f'\n{header}\n{inner}\n```\n'
+        # Parse body rows
+        tbody_match = _TBODY_RE.search(table_html)
+        if not tbody_match:
+            return table_html
 
-        pattern = r'<pre[^>]*?((?:class|data-)[^>]*)?>\s*<code[^>]*?((?:class|data-)[^>]*)?>(.*?)</code>\s*</pre>'
-        return re.sub(pattern, replace_pre_code, content, flags=re.DOTALL)
+        # Rows and cells are matched in place within the table (pos/endpos)
+        # rather than on sliced copies of the tbody and of each row
+        cards = []
+        for row_match in _TR_RE.finditer(table_html, tbody_match.start(1), tbody_match.end(1)):
+            cells = [m.group(1).strip()
+                     for m in _TD_RE.finditer(table_html, row_match.start(1), row_match.end(1))]
 
-    def _convert_card_tables(self, content: str) -> str:
-        """Convert GitBook <table data-view="cards"> to Mintlify CardGroup/Card."""
-        def replace_card_table(match):
-            table_html = match.group(0)
-
-            # Parse column types from <thead> <th> attributes
-            col_types = []  # 'title', 'description', 'target', 'cover', 'hidden'
-            for th_match in re.finditer(r'<th\b([^>]*)>', table_html):
-                attrs = th_match.group(1)
-                if 'data-card-target' in attrs:
-                    col_types.append('target')
-                elif 'data-card-cover' in attrs and 'data-card-cover-dark' not in attrs:
-                    col_types.append('cover')
-                elif 'data-hidden' in attrs:
-                    col_types.append('hidden')
-                elif not col_types:
-                    col_types.append('title')
-                else:
-                    col_types.append('description')
-
-            # Parse body rows
-            tbody_match = re.search(r'<tbody>(.*?)</tbody>', table_html, re.DOTALL)
-            if not tbody_match:
-                return table_html
-
-            cards = []
-            for row_match in re.finditer(r'<tr>(.*?)</tr>', tbody_match.group(1), re.DOTALL):
-                row = row_match.group(1)
-                cells = [m.group(1).strip() for m in re.finditer(r'<td[^>]*>(.*?)</td>', row, re.DOTALL)]
-
-                title = ''
-                description = ''
-                href = ''
-                img = ''
-
-                for i, cell in enumerate(cells):
-                    col_type = col_types[i] if i < len(col_types) else 'hidden'
-
-                    if col_type == 'title':
-                        title = re.sub(r'<[^>]+>', '', cell).strip()
-                    elif col_type == 'description':
-                        description = cell.strip()
-                    elif col_type == 'target':
-                        link_match = re.search(r'<a\s+href="([^"]+)"', cell)
-                        if link_match:
-                            raw_href = link_match.group(1)
-                            if not raw_href.startswith(('/broken/', 'http')):
-                                href = self._convert_md_path(raw_href)
-                                if not href.startswith(('http', '#', '/')):
-                                    href = '/' + href
-                    elif col_type == 'cover':
-                        link_match = re.search(r'<a\s+href="([^"]+)"', cell)
-                        if link_match:
-                            img_src = link_match.group(1)
-                            gitbook_match = re.search(r'\.gitbook/assets/(.+)', img_src)
-                            if gitbook_match:
-                                filename = re.sub(r'[^\w.\-]', '-', gitbook_match.group(1))
-                                img = f'/images/{filename}'
-                            else:
-                                img = img_src
-
-                if title:
-                    card_attrs = f'title="{self._escape_yaml(title)}"'
-                    if href:
-                        card_attrs += f' href="{href}"'
-                    if img:
-                        card_attrs += f' img="{img}"'
-                    card = f'<Card {card_attrs}>\n{description}\n</Card>'
-                    cards.append(card)
-
-            if not cards:
-                return table_html
-
-            # Check for data-card-size="large" → 2 columns, otherwise 3
-            is_large = 'data-card-size="large"' in table_html
-            max_cols = 2 if is_large else 3
-            cols = min(len(cards), max_cols)
-            result = f'\n<CardGroup cols="{cols}">\n\n'
-            result += '\n\n'.join(cards)
-            result += '\n\n</CardGroup>\n'
-            return result
-
-        pattern = r'<table[^>]*data-view="cards"[^>]*>.*?</table>'
-        return re.sub(pattern, replace_card_table, content, flags=re.DOTALL)
+            title = ''
+            description = ''
+            href = ''
+            img = ''
+
+            for i, cell in enumerate(cells):
+                col_type = col_types[i] if i < len(col_types) else 'hidden'
+
+                if col_type == 'title':
+                    title = _HTML_TAG_RE.sub('', cell).strip()
+                elif col_type == 'description':
+                    description = cell.strip()
+                elif col_type == 'target':
+                    link_match = _A_HREF_RE.search(cell)
+                    if link_match:
+                        raw_href = link_match.group(1)
+                        if not raw_href.startswith(('/broken/', 'http')):
+                            href = self._convert_md_path(raw_href)
+                            if not href.startswith(('http', '#', '/')):
+                                href = '/' + href
+                elif col_type == 'cover':
+                    link_match = _A_HREF_RE.search(cell)
+                    if link_match:
+                        img_src = link_match.group(1)
+                        gitbook_match = _ASSET_PATH_RE.search(img_src)
+                        if gitbook_match:
+                            filename = clean_asset_filename(gitbook_match.group(1))
+                            img = f'/images/{filename}'
+                        else:
+                            img = img_src
+
+            if title:
+                card_attrs = f'title="{self._escape_yaml(title)}"'
+                if href:
+                    card_attrs += f' href="{href}"'
+                if img:
+                    card_attrs += f' img="{img}"'
+                card = f'<Card {card_attrs}>\n{description}\n</Card>'
+                cards.append(card)
+
+        if not cards:
+            return table_html
+
+        # Check for data-card-size="large" → 2 columns, otherwise 3
+        is_large = 'data-card-size="large"' in table_html
+        max_cols = 2 if is_large else 3
+        cols = min(len(cards), max_cols)
+        result = f'\n<CardGroup cols="{cols}">\n\n'
+        result += '\n\n'.join(cards)
+        result += '\n\n</CardGroup>\n'
+        return result
 
     def _cleanup_template_tags(self, content: str) -> str:
         """Remove any remaining {% %} template tags that weren't caught by specific converters."""
-        # Remove standalone end tags
-        content = re.sub(r'\{%\s*end\w+\s*%\}', '', content)
-        # Flag and REMOVE any remaining opening tags
-        remaining = re.findall(r'\{%\s*(\w+)[^%]*%\}', content)
-        for tag in remaining:
-            if tag not in ('raw', 'endraw'):
-                self.qa_issues.append(f'Unconverted template tag: {{% {tag} %}}')
-        # Remove all remaining template tags
-        content = re.sub(r'\{%[^%]*%\}', '', content)
-        return content
+        return _LEFTOVER_TAG_RE.sub(self._remove_leftover_tag, content)
+
+    def _remove_leftover_tag(self, match) -> str:
+        """Drop a leftover template tag, flagging unconverted opening tags."""
+        tag = match.group(1)
+        if tag and tag not in ('raw', 'endraw'):
+            self.qa_issues.append(f'Unconverted template tag: {{% {tag} %}}')
+        return ''
 
     # ---- Standard Markdown Adjustments ----
 
     def _convert_images(self, content: str) -> str:
         """Rewrite image paths from .gitbook/assets/ to /images/."""
-        def replace_image(match):
-            alt = match.group(1)
-            src = match.group(2)
-
-            # Rewrite .gitbook/assets paths (handle relative paths)
-            gitbook_match = re.search(r'\.gitbook/assets/(.+)', src)
-            if gitbook_match:
-                filename = gitbook_match.group(1)
-                # Clean filename
-                filename = re.sub(r'[^\w.\-]', '-', filename)
-                src = f'/images/{filename}'
-
-            return f'![{alt}]({src})'
-
-        pattern = r'!\[([^\]]*)\]\(([^)]+)\)'
-        content = re.sub(pattern, replace_image, content)
-
-        # Also handle <img> tags with .gitbook/assets paths
-        def replace_img_tag(match):
-            full_tag = match.group(0)
-            src_match = re.search(r'src="([^"]*\.gitbook/assets/[^"]*)"', full_tag)
-            if src_match:
-                old_src = src_match.group(1)
-                filename = old_src.split('/')[-1]
-                filename = re.sub(r'[^\w.\-]', '-', filename)
-                new_src = f'/images/{filename}'
-                full_tag = full_tag.replace(src_match.group(0), f'src="{new_src}"')
-            return full_tag
-
-        content = re.sub(r'<img\s[^>]*>', replace_img_tag, content)
-
-        return content
+        # Markdown images and <img> tags are rewritten in the same scan
+        return _IMAGE_RE.sub(self._replace_image, content)
+
+    def _replace_image(self, match) -> str:
+        """Rewrite a markdown image (or <img> tag) pointing at .gitbook/assets/."""
+        if match.group(2) is None:
+            return self._replace_img_tag(match)
+        alt = match.group(1)
+        src = match.group(2)
+
+        # Rewrite .gitbook/assets paths (handle relative paths)
+        gitbook_match = _ASSET_PATH_RE.search(src)
+        if gitbook_match:
+            filename = gitbook_match.group(1)
+            # Clean filename
+            filename = clean_asset_filename(filename)
+            src = f'/images/{filename}'
+
+        return f'![{alt}]({src})'
+
+    def _replace_img_tag(self, match) -> str:
+        """Rewrite an <img> tag pointing at .gitbook/assets/."""
+        full_tag = match.group(0)
+        old_src = match.group(3)
+        if old_src:
+            filename = old_src.split('/')[-1]
+            filename = clean_asset_filename(filename)
+            new_src = f'/images/{filename}'
+            full_tag = full_tag.replace(f'src="{old_src}"', f'src="{new_src}"')
+        return full_tag
 
     def _convert_links(self, content: str) -> str:
         """Convert .md file links to Mintlify-style paths."""
-        def replace_link(match):
-            text = match.group(1)
-            href = match.group(2)
+        # Match markdown links but not image links
+        return _MD_LINK_RE.sub(self._replace_link, content)
 
-            # Strip markdown link title attributes (e.g., 'path.md "mention"')
-            title_match = re.match(r'^(.+?)\s+"[^"]*"\s*$', href)
-            if title_match:
-                href = title_match.group(1)
+    def _replace_link(self, match) -> str:
+        """Rewrite one markdown link to a Mintlify path."""
+        text = match.group(1)
+        href = match.group(2)
 
-            # Skip external links, anchors, and images
-            if href.startswith(('http://', 'https://', '#', 'mailto:')):
-                return match.group(0)
+        # Strip markdown link title attributes (e.g., 'path.md "mention"')
+        title_match = _LINK_TITLE_RE.match(href)
+        if title_match:
+            href = title_match.group(1)
 
-            # Convert .md path to Mintlify path
-            href = self._convert_md_path(href)
+        # Skip external links, anchors, and images
+        if href.startswith(('http://', 'https://', '#', 'mailto:')):
+            return match.group(0)
 
-            return f'[{text}](/{href})'
+        # Convert .md path to Mintlify path
+        href = self._convert_md_path(href)
 
-        # Match markdown links but not image links
-        pattern = r'(?<!!)\[([^\]]+)\]\(([^)]+)\)'
-        return re.sub(pattern, replace_link, content)
+        return f'[{text}](/{href})'
 
     def _convert_md_path(self, path: str) -> str:
         """Convert a GitBook .md file path to a Mintlify page path."""
-        import posixpath
-
-        # Preserve fragment
-        fragment = ''
-        if '#' in path:
-            path, fragment = path.split('#', 1)
-            fragment = '#' + fragment
-
-        # Remove .md extension
-        path = re.sub(r'\.md$', '', path)
-
-        # Handle README files (GitBook uses README.md as group index)
-        path = re.sub(r'/README$', '', path)
-        if path == 'README':
-            path = 'index'
-
-        # Remove leading ./
-        path = re.sub(r'^\./', '', path)
-
-        # Resolve relative paths against current page directory
-        if not path.startswith('/') and self._current_page_dir:
-            # Path is relative to the current file's directory
-            path = posixpath.normpath(posixpath.join(self._current_page_dir, path))
-
-        # Clean up
-        path = path.strip('/')
-
-        return path + fragment
+        return _resolve_md_path(self._current_page_dir, path)
 
     def _clean_output(self, text: str) -> str:
         """Clean up the final MDX output."""
+        # Each pass below is skipped when the text cannot contain its target
+
         # Strip HTML anchor tags GitBook adds to headings
-        text = re.sub(r'\s*<a\s+href="#[^"]*"\s+id="[^"]*"\s*>\s*</a>', '', text)
-        text = re.sub(r'\s*<a\s+id="[^"]*"\s+href="#[^"]*"\s*>\s*</a>', '', text)
+        if '<a' in text:
+            text = _HEADING_ANCHOR_TAG_RE.sub('', text)
 
         # Strip anchor-only links from markdown headings
         # GitBook adds invisible anchors like [](#some-id) or [](# "some-id")
-        text = re.sub(r'(^#{1,6}\s+.*?)\s*\[(?:[^\]]*)\]\(#[^)]*\)\s*$', r'\1', text, flags=re.MULTILINE)
+        if '](#' in text:
+            text = _HEADING_ANCHOR_LINK_RE.sub(r'\1', text)
 
         # Remove empty HTML paragraphs and empty inline tags
-        text = re.sub(r'<p>\s*</p>', '', text)
-        text = re.sub(r'<strong>\s*</strong>', '', text)
-        text = re.sub(r'<em>\s*</em>', '', text)
+        if '<p>' in text:
+            text = _EMPTY_P_RE.sub('', text)
+        if '<strong>' in text:
+            text = _EMPTY_STRONG_RE.sub('', text)
+        if '<em>' in text:
+            text = _EMPTY_EM_RE.sub('', text)
 
         # Convert <figure>/<picture> wrappers to clean markdown images
-        text = re.sub(r'<figure>.*?</figure>', lambda m: _figure_to_md(m.group(0)), text, flags=re.DOTALL)
-        text = re.sub(r'<picture>.*?</picture>', lambda m: _picture_to_img(m.group(0)), text, flags=re.DOTALL)
+        if '<figure>' in text:
+            text = _FIGURE_RE.sub(_figure_to_md, text)
+        if '<picture>' in text:
+            text = _PICTURE_RE.sub(_picture_to_img, text)
 
         # Make void HTML elements self-closing for MDX compatibility
         # Use a function to avoid double self-closing (/ />)
-        def make_self_closing(tag_name):
-            def replacer(match):
-                attrs = match.group(1).rstrip().rstrip('/')
-                return f'<{tag_name} {attrs.strip()} />'
-            return replacer
-        text = re.sub(r'<img\s([^>]*?)>', make_self_closing('img'), text)
-        text = re.sub(r'<br\s*/?>', '<br />', text)
-        text = re.sub(r'<hr\s*/?>', '<hr />', text)
+        if '<img' in text:
+            text = _OPEN_IMG_RE.sub(_self_close_img, text)
+        if '<br' in text or '<hr' in text:
+            text = _BR_HR_RE.sub(r'<\1 />', text)
 
         # Fix any double self-closing patterns (e.g., / />)
-        text = re.sub(r'/\s+/>', '/>', text)
+        text = _DOUBLE_SELF_CLOSE_RE.sub('/>', text)
 
         # Strip <mark> tags (GitBook colored text) — keep inner text
-        text = re.sub(r'<mark[^>]*>(.*?)</mark>', r'\1', text, flags=re.DOTALL)
-
-        # Rejoin inline images that GitBook split across lines.
-        # GitBook exports inline icons as block-level <picture> elements with
-        # &#x20; connectors: text&#x20;\n\n    <img .../>\n\n    &#x20;text
-        # Both sides have &#x20;
-        text = re.sub(
-            r'&#x20;\s*\n\s*\n\s*(<img\s[^>]*/\s*>)\s*\n\s*\n\s*&#x20;',
-            r' \1 ',
-            text,
-        )
-        # Only &#x20; before the image
-        text = re.sub(
-            r'&#x20;\s*\n\s*\n\s*(<img\s[^>]*/\s*>)\s*\n',
-            r' \1\n',
-            text,
-        )
-        # Only &#x20; after the image
-        text = re.sub(
-            r'\n\s*(<img\s[^>]*/\s*>)\s*\n\s*\n\s*&#x20;',
-            r' \1 ',
-            text,
-        )
+        if '<mark' in text:
+            text = _MARK_RE.sub(r'\1', text)
+
+        if '&#x20;' in text:
+            # Rejoin inline images that GitBook split across lines.
+            # GitBook exports inline icons as block-level <picture> elements with
+            # &#x20; connectors: text&#x20;\n\n    <img .../>\n\n    &#x20;text
+            # Both sides have &#x20;
+            text = _INLINE_IMG_BOTH_RE.sub(r' \1 ', text)
+            # Only &#x20; before the image
+            text = _INLINE_IMG_BEFORE_RE.sub(r' \1\n', text)
+            # Only &#x20; after the image
+            text = _INLINE_IMG_AFTER_RE.sub(r' \1 ', text)
 
         # Rejoin indented <img> tags that are mid-sentence within list items.
         # Pattern: text\n\n    <img .../>\n\n    lowercase-continuation
-        text = re.sub(
-            r'(\S[^\n]*)\n\n(\s+)(<img\s[^>]*/\s*>)\n\n\2([a-z][^\n]*)',
-            r'\1 \3 \4',
-            text,
-        )
+        if '<img' in text:
+            text = _LIST_IMG_RE.sub(r'\1 \3 \4', text)
 
         # Clean up remaining &#x20; entities (just trailing spaces from GitBook)
         text = text.replace('&#x20;', ' ')
@@ -705,7 +774,8 @@ class MarkdownConverter:
         # Mintlify wraps markdown images in a block-level zoom component, so we
         # keep inline icons as <img> with explicit inline styling instead.
         # Uses a sentinel to survive the JSX brace escaping pass.
-        text = _style_inline_imgs(text)
+        if '<img ' in text:
+            text = _style_inline_imgs(text)
 
         # Escape curly braces in text that MDX would interpret as JSX expressions
         text = _escape_jsx_braces(text)
@@ -714,24 +784,90 @@ class MarkdownConverter:
         text = text.replace('__INLINE_IMG_STYLE__', 'style={{display:"inline",height:"1em",verticalAlign:"middle"}}')
 
         # Wrap 2+ adjacent Accordion blocks in AccordionGroup
-        text = _wrap_accordion_groups(text)
+        if '<Accordion' in text:
+            text = _wrap_accordion_groups(text)
 
         # Wrap 2+ adjacent code blocks with different languages in CodeGroup
-        text = _wrap_code_groups(text)
+        if '```' in text:
+            text = _wrap_code_groups(text)
 
-        # Remove lines that are only whitespace
-        text = re.sub(r'^[^\S\n]+$', '', text, flags=re.MULTILINE)
-        # Collapse 3+ consecutive blank lines to 2
-        text = re.sub(r'\n{4,}', '\n\n\n', text)
-        # Remove trailing whitespace
+        # Remove trailing whitespace (whitespace-only lines become blank)
         text = '\n'.join(line.rstrip() for line in text.split('\n'))
+        # Collapse 3+ consecutive blank lines to 2
+        if '\n\n\n\n' in text:
+            text = _EXCESS_BLANK_LINES_RE.sub('\n\n\n', text)
         # Ensure single trailing newline
         text = text.strip() + '\n'
         return text
 
 
+def _partition_frontmatter(content: str) -> tuple[Optional[str], str]:
+    """Split raw frontmatter text from the body without parsing it.
+
+    Only scans up to the closing '---'. Returns (None, content) when the
+    content has no frontmatter block.
+    """
+    if not content.startswith('---'):
+        return None, content
+    end = content.find('---', 3)
+    if end == -1:
+        return None, content
+    return content[3:end], content[end + 3:]
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve_md_path(page_dir: str, path: str) -> str:
+    """Resolve a GitBook .md link relative to page_dir into a Mintlify page path."""
+    # Preserve fragment
+    fragment = ''
+    if '#' in path:
+        path, fragment = path.split('#', 1)
+        fragment = '#' + fragment
+
+    # Remove .md extension
+    path = path.removesuffix('.md')
+
+    # Handle README files (GitBook uses README.md as group index)
+    path = path.removesuffix('/README')
+    if path == 'README':
+        path = 'index'
+
+    # Remove leading ./
+    path = path.removeprefix('./')
+
+    # Resolve relative paths against current page directory
+    if not path.startswith('/') and page_dir:
+        # Path is relative to the current file's directory
+        path = posixpath.normpath(posixpath.join(page_dir, path))
+
+    # Clean up
+    path = path.strip('/')
+
+    return path + fragment
+
+
+@functools.lru_cache(maxsize=1024)
+def _duplicate_title_re(title: str) -> re.Pattern:
+    """Compile the pattern matching an H1 that repeats the given title."""
+    return re.compile(rf'^\s*#\s+{re.escape(title)}\s*$', re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=256)
+def _read_include(full_path: str) -> Optional[str]:
+    """Return an included file's body without its frontmatter, or None if it is missing."""
+    if not os.path.isfile(full_path):
+        return None
+    with open(full_path, 'r', encoding='utf-8', errors='replace') as f:
+        included = f.read()
+    _, included_body = _partition_frontmatter(included)
+    return included_body.strip()
+
+
 def _escape_jsx_braces(text: str) -> str:
     """Escape { and } outside of fenced code blocks so MDX doesn't treat them as JSX."""
+    if '{' not in text and '}' not in text:
+        return text
+
     lines = text.split('\n')
     result = []
     in_code_block = False
@@ -745,7 +881,7 @@ def _escape_jsx_braces(text: str) -> str:
             result.append(line)
             continue
 
-        if in_code_block:
+        if in_code_block or ('{' not in line and '}' not in line):
             result.append(line)
             continue
 
@@ -754,148 +890,182 @@ def _escape_jsx_braces(text: str) -> str:
         # - Inline code: `...{...}...`
 
         # Split by inline code spans to protect them
-        parts = re.split(r'(`[^`]*`)', line)
+        parts = _INLINE_CODE_SPLIT_RE.split(line)
         new_parts = []
         for part in parts:
             if part.startswith('`') and part.endswith('`'):
                 new_parts.append(part)
+            elif '{/*' in part:
+                # Escape around JSX comments {/* ... */}, which split out
+                # at the odd indices and are kept as-is
+                pieces = _JSX_COMMENT_SPLIT_RE.split(part)
+                for i in range(0, len(pieces), 2):
+                    pieces[i] = pieces[i].replace('{', '\\{').replace('}', '\\}')
+                new_parts.append(''.join(pieces))
             else:
-                # Protect JSX comments {/* ... */} with sentinel
-                protected = []
-                part = re.sub(r'\{/\*.*?\*/\}', lambda m: (protected.append(m.group(0)), f'\x00JSXC{len(protected)-1}\x00')[1], part)
-                # Escape all remaining braces
-                part = part.replace('{', '\\{').replace('}', '\\}')
-                # Restore protected JSX comments
-                for i, p in enumerate(protected):
-                    part = part.replace(f'\x00JSXC{i}\x00', p)
-                new_parts.append(part)
+                new_parts.append(part.replace('{', '\\{').replace('}', '\\}'))
         result.append(''.join(new_parts))
 
     return '\n'.join(result)
 
 
-def _figure_to_md(figure_html: str) -> str:
-    """Convert a <figure> block to a markdown image."""
-    img_match = re.search(r'<img\s[^>]*src="([^"]*)"[^>]*>', figure_html)
+def _figure_to_md(match) -> str:
+    """Convert a matched <figure> block to a markdown image."""
+    figure_html = match.group(0)
+    img_match = _IMG_SRC_TAG_RE.search(figure_html)
     if not img_match:
         return ''
     src = img_match.group(1)
     # Rewrite .gitbook/assets paths
-    gitbook_match = re.search(r'\.gitbook/assets/(.+)', src)
+    gitbook_match = _ASSET_PATH_RE.search(src)
     if gitbook_match:
         filename = gitbook_match.group(1)
-        filename = re.sub(r'[^\w.\-]', '-', filename)
+        filename = clean_asset_filename(filename)
         src = f'/images/{filename}'
-    alt_match = re.search(r'alt="([^"]*)"', figure_html)
+    alt_match = _ALT_ATTR_RE.search(figure_html)
     alt = alt_match.group(1) if alt_match else ''
-    caption_match = re.search(r'<figcaption>(.*?)</figcaption>', figure_html, re.DOTALL)
+    caption_match = _FIGCAPTION_RE.search(figure_html)
     result = f'![{alt}]({src})'
     if caption_match:
         result += f'\n*{caption_match.group(1).strip()}*'
     return result
 
 
-def _picture_to_img(picture_html: str) -> str:
-    """Extract a simple image from a <picture> element."""
-    img_match = re.search(r'<img\s([^>]*)>', picture_html)
+def _picture_to_img(match) -> str:
+    """Extract a simple image from a matched <picture> element."""
+    img_match = _IMG_ATTRS_RE.search(match.group(0))
     if img_match:
         attrs = img_match.group(1)
         # Rewrite .gitbook/assets in src
-        def rewrite_src(m):
-            src = m.group(1)
-            gitbook_match = re.search(r'\.gitbook/assets/(.+)', src)
-            if gitbook_match:
-                filename = gitbook_match.group(1)
-                filename = re.sub(r'[^\w.\-]', '-', filename)
-                return f'src="/images/{filename}"'
-            return m.group(0)
-        attrs = re.sub(r'src="([^"]*)"', rewrite_src, attrs)
+        attrs = _SRC_ATTR_RE.sub(_rewrite_asset_src, attrs)
         return f'<img {attrs} />'
     return ''
 
 
+def _rewrite_asset_src(match) -> str:
+    """Point a src="..." attribute at /images/ if it references .gitbook/assets/."""
+    src = match.group(1)
+    gitbook_match = _ASSET_PATH_RE.search(src)
+    if gitbook_match:
+        filename = gitbook_match.group(1)
+        filename = clean_asset_filename(filename)
+        return f'src="/images/{filename}"'
+    return match.group(0)
+
+
+def _self_close_img(match) -> str:
+    """Rewrite an <img ...> tag as self-closing, without doubling an existing '/'."""
+    attrs = match.group(1).rstrip().rstrip('/')
+    return f'<img {attrs.strip()} />'
+
+
 def _wrap_accordion_groups(text: str) -> str:
     """Wrap 2+ adjacent <Accordion>...</Accordion> blocks in <AccordionGroup>."""
-    # Match runs of 2+ Accordion blocks separated only by whitespace
-    pattern = r'((?:<Accordion\b[^>]*>.*?</Accordion>\s*){2,})'
-    def replacer(match):
-        block = match.group(1).strip()
-        return f'\n<AccordionGroup>\n\n{block}\n\n</AccordionGroup>\n'
-    return re.sub(pattern, replacer, text, flags=re.DOTALL)
+    # Walk the tags once with a stack of open accordions. Sibling accordions
+    # separated only by whitespace form a run; nested accordions are grouped
+    # among their own siblings.
+    runs = []
+    open_starts = []
+    level_runs = [[]]  # current run of (start, end) spans per nesting level
+    for match in _ACCORDION_TAG_RE.finditer(text):
+        if match.group(0)[1] != '/':
+            open_starts.append(match.start())
+            level_runs.append([])
+            continue
+        if not open_starts:
+            continue  # stray closing tag
+        start = open_starts.pop()
+        runs.append(level_runs.pop())  # this accordion's children are done
+        run = level_runs[-1]
+        if run and not _is_blank(text, run[-1][1], start):
+            runs.append(run)
+            run = level_runs[-1] = []
+        run.append((start, match.end()))
+    runs.extend(level_runs)
+
+    # Open the group before the first block; the close replaces the
+    # whitespace after the last one
+    edits = []
+    for run in runs:
+        if len(run) >= 2:
+            first_start = run[0][0]
+            last_end = run[-1][1]
+            edits.append((first_start, first_start, '\n<AccordionGroup>\n\n'))
+            edits.append((last_end, _WHITESPACE_RUN_RE.match(text, last_end).end(),
+                          '\n\n</AccordionGroup>\n'))
+    if not edits:
+        return text
+
+    edits.sort()
+    parts = []
+    pos = 0
+    for start, end, replacement in edits:
+        parts.append(text[pos:start])
+        parts.append(replacement)
+        pos = end
+    parts.append(text[pos:])
+    return ''.join(parts)
+
+
+def _is_blank(text: str, start: int, end: int) -> bool:
+    """Whether text[start:end] is empty or whitespace only."""
+    return start == end or text[start:end].isspace()
 
 
 def _wrap_code_groups(text: str) -> str:
     """Wrap 2+ adjacent fenced code blocks with different languages in <CodeGroup>."""
-    lines = text.split('\n')
-    result = []
-    i = 0
-
-    while i < len(lines):
-        # Look for a fenced code block start
-        if lines[i].strip().startswith('```') and lines[i].strip() != '```':
-            # Collect consecutive code blocks (separated by blank lines)
-            blocks = []
-            block_start = i
-            while i < len(lines):
-                opening = lines[i].strip()
-                if not opening.startswith('```') or opening == '```':
-                    break
-                # Extract language from opening fence
-                lang = opening.lstrip('`').split()[0] if opening.lstrip('`').split() else ''
-                # Find the closing ```
-                j = i + 1
-                while j < len(lines) and lines[j].strip() != '```':
-                    j += 1
-                if j >= len(lines):
-                    break  # unclosed block, bail
-                blocks.append({
-                    'lang': lang,
-                    'start': i,
-                    'end': j,  # line with closing ```
-                })
-                # Skip past closing ``` and any blank lines
-                k = j + 1
-                while k < len(lines) and lines[k].strip() == '':
-                    k += 1
-                # Check if next non-blank line is another code block
-                if k < len(lines) and lines[k].strip().startswith('```') and lines[k].strip() != '```':
-                    i = k
-                else:
-                    break
-
-            if len(blocks) >= 2:
-                # Check if languages differ
-                langs = {b['lang'] for b in blocks}
-                if len(langs) > 1:
-                    # Wrap in CodeGroup
-                    first = blocks[0]['start']
-                    last = blocks[-1]['end']
-                    # Output everything before the first block that we haven't output yet
-                    code_lines = lines[first:last + 1]
-                    result.append('<CodeGroup>')
-                    result.append('')
-                    result.extend(code_lines)
-                    result.append('')
-                    result.append('</CodeGroup>')
-                    i = last + 1
-                    continue
-                else:
-                    # Same language — don't wrap, just output normally
-                    last = blocks[-1]['end']
-                    result.extend(lines[block_start:last + 1])
-                    i = last + 1
-                    continue
-            else:
-                # Single block, output normally
-                last = blocks[-1]['end'] if blocks else i
-                result.extend(lines[block_start:last + 1])
-                i = last + 1
-                continue
+    parts = []
+    pos = 0
+    run = []  # consecutive blocks separated only by blank lines
+    for match in _CODE_BLOCK_RE.finditer(text):
+        if run and text[run[-1].end():match.start()].strip():
+            pos = _flush_code_run(text, run, pos, parts)
+            run = []
+        run.append(match)
+    if run:
+        pos = _flush_code_run(text, run, pos, parts)
+
+    if not parts:
+        return text
+    parts.append(text[pos:])
+    return ''.join(parts)
 
-        result.append(lines[i])
-        i += 1
 
-    return '\n'.join(result)
+def _flush_code_run(text: str, run: list, pos: int, parts: list) -> int:
+    """Emit a run of adjacent code blocks as a CodeGroup if their languages differ.
+
+    Appends to parts and returns the new output position in text.
+    """
+    # Same language (or a single block) — leave as is
+    if len({_code_block_lang(m) for m in run}) < 2:
+        return pos
+    start = run[0].start()
+    end = run[-1].end()
+    parts.append(text[pos:start])
+    parts.append(f'<CodeGroup>\n\n{text[start:end]}\n\n</CodeGroup>')
+    return end
+
+
+def _code_block_lang(match) -> str:
+    """Language of a matched code block — first word of its fence info string."""
+    words = match.group(1).lstrip('`').split()
+    return words[0] if words else ''
+
+
+def _fence_line_starts(text: str) -> list[int]:
+    """Offsets of the lines whose first non-blank characters are ```, in order."""
+    starts = []
+    i = text.find('```')
+    while i != -1:
+        start = text.rfind('\n', 0, i) + 1
+        if start == i or text[start:i].isspace():
+            starts.append(start)
+            # One fence per line
+            i = text.find('\n', i)
+            if i == -1:
+                break
+        i = text.find('```', i + 1)
+    return starts
 
 
 def _style_inline_imgs(text: str) -> str:
@@ -906,34 +1076,45 @@ def _style_inline_imgs(text: str) -> str:
     Uses __INLINE_IMG_STYLE__ sentinel which gets replaced after brace escaping.
     Standalone <img> tags (on their own line) are left as-is.
     """
-    lines = text.split('\n')
-    result = []
-    in_code_block = False
-
-    for line in lines:
-        if line.strip().startswith('```'):
-            in_code_block = not in_code_block
-
-        if in_code_block or '<img ' not in line:
-            result.append(line)
+    # Only lines containing '<img ' are visited; whether such a line is in a
+    # code block follows from the number of fence lines up to and including it
+    fences = _fence_line_starts(text)
+    parts = []
+    pos = 0
+    img = text.find('<img ')
+    while img != -1:
+        start = text.rfind('\n', 0, img) + 1
+        end = text.find('\n', img)
+        if end == -1:
+            end = len(text)
+        line = text[start:end]
+        img = text.find('<img ', end)
+
+        if bisect.bisect_right(fences, start) % 2:
             continue
 
         # Check if the line has content besides <img> tags and whitespace
-        without_imgs = re.sub(r'<img\s[^>]*/\s*>', '', line).strip()
+        without_imgs = _SELF_CLOSED_IMG_RE.sub('', line).strip()
         if not without_imgs:
             # Standalone image on its own line — keep as-is
-            result.append(line)
             continue
 
         # Inline image — add inline style sentinel
-        def add_inline_style(m):
-            tag = m.group(0)
-            # Don't double-add if already has a style
-            if '__INLINE_IMG_STYLE__' in tag or 'style=' in tag:
-                return tag
-            # Insert sentinel before the closing />
-            return tag.replace(' />', ' __INLINE_IMG_STYLE__ />')
+        parts.append(text[pos:start])
+        parts.append(_SELF_CLOSED_IMG_RE.sub(_add_inline_style, line))
+        pos = end
 
-        result.append(re.sub(r'<img\s[^>]*/\s*>', add_inline_style, line))
-
-    return '\n'.join(result)
+    if not parts:
+        return text
+    parts.append(text[pos:])
+    return ''.join(parts)
+
+
+def _add_inline_style(match) -> str:
+    """Insert the inline style sentinel into a matched self-closing <img> tag."""
+    tag = match.group(0)
+    # Don't double-add if already has a style
+    if '__INLINE_IMG_STYLE__' in tag or 'style=' in tag:
+        return tag
+    # Insert sentinel before the closing />
+    return tag.replace(' />', ' __INLINE_IMG_STYLE__ />')
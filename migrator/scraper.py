@@ -1,7 +1,10 @@
 """Scrape individual page content from a GitBook site."""
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Iterator, Optional
 from urllib.parse import urljoin
 
 import requests
@@ -50,19 +53,72 @@ class GitBookScraper:
         'meta[property="og:description"]',
     ]
 
-    def __init__(self, session: requests.Session):
+    def __init__(self, session: requests.Session,
+                 session_factory: Optional[Callable[[], requests.Session]] = None,
+                 request_interval: float = 0.3):
         self.session = session
+        # Minimum delay between the starts of two page requests, shared by
+        # all scraping threads so concurrency doesn't raise the request rate
+        self.request_interval = request_interval
+        self._next_request_at = 0.0
+        self._rate_lock = threading.Lock()
+        self._session_factory = session_factory
+        self._thread_sessions = threading.local()
 
     def scrape_page(self, url: str) -> Optional[PageContent]:
         """Scrape a single page and return its content."""
+        content, error = self._scrape(url, self.session)
+        if error:
+            print(f"    Warning: {error}")
+        return content
+
+    def scrape_pages(self, urls: list[str],
+                     concurrency: int = 4) -> Iterator[tuple[Optional[PageContent], str]]:
+        """Scrape pages concurrently, yielding (content, error) in the order of `urls`.
+
+        Errors are returned rather than printed so the caller can report them
+        in sequence. Each worker thread uses its own session from
+        `session_factory`; without one, pages are scraped one at a time.
+        """
+        workers = min(concurrency, len(urls))
+        if workers <= 1 or self._session_factory is None:
+            for url in urls:
+                yield self._scrape(url, self.session)
+            return
+
+        # Fetching is bound by round-trip latency, so overlap requests in threads
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(self._scrape_in_thread, urls)
+
+    def _scrape_in_thread(self, url: str) -> tuple[Optional[PageContent], str]:
+        """Scrape a page with the calling thread's own session."""
+        session = getattr(self._thread_sessions, 'session', None)
+        if session is None:
+            session = self._thread_sessions.session = self._session_factory()
+        return self._scrape(url, session)
+
+    def _wait_for_request_slot(self):
+        """Sleep until at least request_interval has passed since the last request start."""
+        with self._rate_lock:
+            now = time.monotonic()
+            start = max(now, self._next_request_at)
+            self._next_request_at = start + self.request_interval
+        if start > now:
+            time.sleep(start - now)
+
+    def _scrape(self, url: str, session: requests.Session) -> tuple[Optional[PageContent], str]:
+        """Fetch and extract one page; returns (content, error message)."""
+        self._wait_for_request_slot()
         try:
-            resp = self.session.get(url, timeout=15)
+            resp = session.get(url, timeout=15)
             resp.raise_for_status()
         except requests.RequestException as e:
-            print(f"    Warning: Failed to fetch {url}: {e}")
-            return None
+            return None, f"Failed to fetch {url}: {e}"
 
-        soup = BeautifulSoup(resp.text, 'lxml')
+        # Response.text re-decodes (and may re-sniff the charset) on every
+        # access, so decode once for both the soup and raw_html
+        html = resp.text
+        soup = BeautifulSoup(html, 'lxml')
 
         # Extract title
         title = self._extract_title(soup)
@@ -74,16 +130,15 @@ class GitBookScraper:
         content = self._extract_content(soup)
 
         if not content:
-            print(f"    Warning: No content found on {url}")
-            return None
+            return None, f"No content found on {url}"
 
         return PageContent(
             url=url,
             title=title,
             description=description,
             html_content=content,
-            raw_html=resp.text,
-        )
+            raw_html=html,
+        ), ''
 
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """Extract the page title."""
@@ -123,10 +178,27 @@ class GitBookScraper:
 
         # Fallback: find the largest text block
         candidates = soup.find_all(['main', 'article', 'div'])
+        if not candidates:
+            return None
+
+        # Same measure as len(el.get_text(strip=True)), but each text node is
+        # measured once and credited to its candidate ancestors rather than
+        # re-walking every candidate's subtree
+        text_lens = dict.fromkeys(map(id, candidates), 0)
+        string_types = candidates[0].interesting_string_types or Tag.MAIN_CONTENT_STRING_TYPES
+        for node in soup.descendants:
+            if type(node) in string_types:
+                node_len = len(node.strip())
+                if node_len:
+                    for parent in node.parents:
+                        key = id(parent)
+                        if key in text_lens:
+                            text_lens[key] += node_len
+
         best = None
         best_len = 0
         for el in candidates:
-            text_len = len(el.get_text(strip=True))
+            text_len = text_lens[id(el)]
             if text_len > best_len:
                 best = el
                 best_len = text_len
@@ -1,11 +1,30 @@
 """Parse GitBook SUMMARY.md into navigation structure and page list."""
 
+import functools
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Optional
 
+_HEADING_ANCHOR_RE = re.compile(r'\s*<a[^>]*>.*?</a>\s*')
+# One SUMMARY.md line of interest: a "## Group" header or a "* [Title](path)"
+# page entry. Everything else (blank lines, the "# " heading, prose) is skipped
+# by the regex engine rather than line by line.
+_SUMMARY_ENTRY_RE = re.compile(
+    r'^[^\S\n]*## (?P<group>[^\S\n]*\S[^\n]*)'
+    r'|^(?P<indent>[^\S\n]*)\*[^\S\n]+\[(?P<title>[^\]\n]+)\]\((?P<path>[^)\n]+)\)',
+    re.MULTILINE,
+)
+_LINK_TITLE_ATTR_RE = re.compile(r'\s+"([^"]*)"\s*$')
+_ICON_LINE_RE = re.compile(r'\n?icon:\s*"?[^"\n]+"?\s*$', re.MULTILINE)
 
-@dataclass
+# Summary entries are created once per SUMMARY.md line; slots drop the
+# per-instance __dict__ where dataclasses support it (Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class SummaryPage:
     """A page entry from SUMMARY.md."""
     title: str
@@ -15,7 +34,7 @@ class SummaryPage:
     sidebar_title: str = ''  # Short title from link title attr (e.g., "Toolbar")
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SummaryGroup:
     """A group/section from SUMMARY.md."""
     title: str
@@ -29,7 +48,6 @@ def parse_summary(content: str) -> tuple[list[SummaryGroup], list[SummaryPage]]:
     Returns:
         (nav_groups, all_pages) — navigation hierarchy and flat page list
     """
-    lines = content.strip().split('\n')
     groups = []
     all_pages = []
     current_group = None
@@ -38,38 +56,28 @@ def parse_summary(content: str) -> tuple[list[SummaryGroup], list[SummaryPage]]:
     # Stack tracks (indent_level, pages_list_ref) for nesting
     nesting_stack = []
 
-    for line in lines:
-        stripped = line.strip()
-
-        # Skip empty lines and the top-level heading
-        if not stripped or stripped.startswith('# '):
-            continue
-
+    for entry in _SUMMARY_ENTRY_RE.finditer(content.strip()):
         # Group headers: ## Group Name
-        if stripped.startswith('## '):
-            group_title = stripped[3:].strip()
+        group_title = entry.group('group')
+        if group_title is not None:
             # Strip HTML anchor tags GitBook adds (e.g., ## Title <a href="..." id="..."></a>)
-            group_title = re.sub(r'\s*<a[^>]*>.*?</a>\s*', '', group_title).strip()
+            group_title = _HEADING_ANCHOR_RE.sub('', group_title.strip()).strip()
             current_group = SummaryGroup(title=group_title)
             groups.append(current_group)
             nesting_stack = []
             continue
 
         # Page entries: * [Title](path.md) or  * [Title](path.md "optional title")
-        link_match = re.match(r'^(\s*)\*\s+\[([^\]]+)\]\(([^)]+)\)', line)
-        if not link_match:
-            continue
-
-        indent = len(link_match.group(1))
-        title = link_match.group(2).strip()
-        path = link_match.group(3).strip()
+        indent = len(entry.group('indent'))
+        title = entry.group('title').strip()
+        path = entry.group('path').strip()
 
         # Extract markdown link title attribute as sidebar title (e.g., 'path.md "Toolbar"')
         sidebar_title = ''
-        title_attr_match = re.search(r'\s+"([^"]*)"\s*$', path)
+        title_attr_match = _LINK_TITLE_ATTR_RE.search(path)
         if title_attr_match:
             sidebar_title = title_attr_match.group(1).strip()
-        path = re.sub(r'\s+"[^"]*"\s*$', '', path)
+            path = path[:title_attr_match.start()]
 
         # Skip external links
         if path.startswith(('http://', 'https://')):
@@ -107,12 +115,13 @@ def parse_summary(content: str) -> tuple[list[SummaryGroup], list[SummaryPage]]:
             # This page is a child — nest under the last item in the parent container
             parent_list = nesting_stack[-1][1]
             last_item = parent_list[-1] if parent_list else None
+            last_type = type(last_item)
 
-            if isinstance(last_item, SummaryGroup):
+            if last_type is SummaryGroup:
                 # Already a sub-group, add to it
                 last_item.pages.append(page)
                 nesting_stack.append((indent, last_item.pages))
-            elif isinstance(last_item, SummaryPage):
+            elif last_type is SummaryPage:
                 # Convert the parent page into a sub-group containing itself and this child
                 sub_group = SummaryGroup(
                     title=last_item.title,
@@ -128,15 +137,14 @@ def parse_summary(content: str) -> tuple[list[SummaryGroup], list[SummaryPage]]:
     return groups, all_pages
 
 
+@functools.lru_cache(maxsize=4096)
 def _to_mintlify_path(gitbook_path: str) -> str:
     """Convert a GitBook file path to a Mintlify page path."""
-    path = gitbook_path
-
     # Remove .md extension
-    path = re.sub(r'\.md$', '', path)
+    path = gitbook_path.removesuffix('.md')
 
     # Handle README files → use directory name
-    path = re.sub(r'/README$', '', path)
+    path = path.removesuffix('/README')
     if path == 'README':
         path = 'index'
 
@@ -148,30 +156,23 @@ def _to_mintlify_path(gitbook_path: str) -> str:
 
 def build_nav_from_summary(groups: list[SummaryGroup]) -> list[dict]:
     """Convert parsed summary groups into mint.json navigation format."""
-    nav = []
-    for group in groups:
-        nav_group = {
-            "group": group.title,
-            "pages": _build_pages(group.pages),
-        }
-        if nav_group["pages"]:
-            nav.append(nav_group)
-    return nav
+    # Top-level groups follow the same rules as nested ones: emitted as
+    # {"group", "pages"} dicts and dropped when they end up empty
+    return _build_pages(groups)
 
 
 def _build_pages(items: list) -> list:
     """Recursively convert a list of SummaryPage/SummaryGroup into nav pages."""
     pages = []
     for item in items:
-        if isinstance(item, SummaryPage):
+        # Exact type checks; use isinstance() if these classes get subclassed
+        item_type = type(item)
+        if item_type is SummaryPage:
             pages.append(item.mintlify_path)
-        elif isinstance(item, SummaryGroup):
-            sub = {
-                "group": item.title,
-                "pages": _build_pages(item.pages),
-            }
-            if sub["pages"]:
-                pages.append(sub)
+        elif item_type is SummaryGroup:
+            sub_pages = _build_pages(item.pages)
+            if sub_pages:
+                pages.append({"group": item.title, "pages": sub_pages})
     return pages
 
 
@@ -179,85 +180,109 @@ def inject_nav_icons(nav: list, output_dir: str) -> list:
     """Add icons to navigation groups and set sidebarTitle for parent pages."""
     import os
 
-    def _read_frontmatter(page_path: str) -> Optional[str]:
-        """Read raw frontmatter string from a converted page."""
+    def _read_page(page_path: str) -> Optional[tuple[str, str, int]]:
+        """Read a converted page as (content, raw frontmatter, closing --- index)."""
+        # A missing page surfaces as an OSError from open(), no stat needed
         mdx_path = os.path.join(output_dir, f"{page_path}.mdx")
-        if not os.path.isfile(mdx_path):
-            return None
         try:
             with open(mdx_path, 'r') as f:
                 content = f.read()
             if not content.startswith('---'):
                 return None
             end = content.index('---', 3)
-            return content[3:end].strip()
+            return content, content[3:end].strip(), end
         except (ValueError, IOError):
             return None
 
     def _extract_field(frontmatter: str, field: str) -> Optional[str]:
         """Extract a field value from frontmatter text."""
-        for line in frontmatter.split('\n'):
-            m = re.match(rf'^{field}:\s*"?([^"]+)"?\s*$', line)
-            if m:
-                return m.group(1).strip()
-        return None
+        m = _frontmatter_field_re(field).search(frontmatter)
+        return m.group(1).strip() if m else None
 
-    def _add_sidebar_title(page_path: str, group_title: str):
+    def _add_sidebar_title(page_path: str, page: tuple[str, str, int], group_title: str):
         """Add sidebarTitle: "Overview" to a page whose title matches its group."""
-        mdx_path = os.path.join(output_dir, f"{page_path}.mdx")
-        if not os.path.isfile(mdx_path):
+        content, frontmatter, end = page
+
+        # Check if title matches group title
+        page_title = _extract_field(frontmatter, 'title')
+        if not page_title or page_title.lower() != group_title.lower():
+            return
+
+        # Don't add if sidebarTitle already exists
+        if 'sidebarTitle:' in frontmatter:
             return
+
+        # Insert sidebarTitle after title line and remove icon
+        new_frontmatter = frontmatter.replace(
+            f'title: "{page_title}"',
+            f'title: "{page_title}"\nsidebarTitle: "Overview"',
+        )
+        new_frontmatter = _ICON_LINE_RE.sub('', new_frontmatter)
+        new_content = f'---\n{new_frontmatter}\n---{content[end + 3:]}'
         try:
-            with open(mdx_path, 'r') as f:
-                content = f.read()
-            if not content.startswith('---'):
-                return
-            end = content.index('---', 3)
-            frontmatter = content[3:end].strip()
-
-            # Check if title matches group title
-            page_title = _extract_field(frontmatter, 'title')
-            if not page_title or page_title.lower() != group_title.lower():
-                return
-
-            # Don't add if sidebarTitle already exists
-            if 'sidebarTitle:' in frontmatter:
-                return
-
-            # Insert sidebarTitle after title line and remove icon
-            new_frontmatter = frontmatter.replace(
-                f'title: "{page_title}"',
-                f'title: "{page_title}"\nsidebarTitle: "Overview"',
-            )
-            new_frontmatter = re.sub(r'\n?icon:\s*"?[^"\n]+"?\s*$', '', new_frontmatter, flags=re.MULTILINE)
-            new_content = f'---\n{new_frontmatter}\n---{content[end + 3:]}'
-            with open(mdx_path, 'w') as f:
+            with open(os.path.join(output_dir, f"{page_path}.mdx"), 'w') as f:
                 f.write(new_content)
-        except (ValueError, IOError):
+        except IOError:
             pass
 
-    def _process_pages(pages: list) -> list:
+    def _collect_first_pages(pages: list, found: list):
         for item in pages:
             if isinstance(item, dict) and 'group' in item:
-                # Find the first string page path in the group
-                first_page = None
-                for p in item['pages']:
-                    if isinstance(p, str):
-                        first_page = p
-                        break
+                first_page = _first_page(item)
                 if first_page:
-                    frontmatter = _read_frontmatter(first_page)
+                    found.append(first_page)
+                _collect_first_pages(item['pages'], found)
+
+    def _process_pages(pages: list) -> list:
+        for item in pages:
+            if isinstance(item, dict) and 'group' in item:
+                first_page = _first_page(item)
+                # The page is read once for both the icon and the sidebar title.
+                # A page heading a second group is re-read, since the first
+                # pass may have rewritten it.
+                if first_page in prefetched:
+                    page = prefetched.pop(first_page)
+                else:
+                    page = _read_page(first_page) if first_page else None
+                if page:
+                    frontmatter = page[1]
                     if frontmatter:
                         icon = _extract_field(frontmatter, 'icon')
                         if icon:
                             item['icon'] = icon
                     # Rename parent page to "Overview" in sidebar
-                    _add_sidebar_title(first_page, item['group'])
+                    _add_sidebar_title(first_page, page, item['group'])
                 # Recurse into nested groups
                 _process_pages(item['pages'])
         return pages
 
+    first_pages = []
+    for group in nav:
+        _collect_first_pages(group.get('pages', []), first_pages)
+
+    # Page reads are I/O-bound, so prefetch them concurrently
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        prefetched = dict(zip(first_pages, executor.map(_read_page, first_pages)))
+
     for group in nav:
         _process_pages(group.get('pages', []))
 
     return nav
+
+
+def _first_page(group: dict) -> Optional[str]:
+    """Return the first direct page path in a nav group, if any."""
+    for p in group['pages']:
+        if isinstance(p, str):
+            return p
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _frontmatter_field_re(field: str) -> re.Pattern:
+    """Compile the pattern matching a `field: value` frontmatter line.
+
+    Newlines are excluded from every class so a single MULTILINE search finds
+    the first matching line without splitting the frontmatter.
+    """
+    return re.compile(rf'^{field}:[^\S\n]*"?([^"\n]+)"?[^\S\n]*$', re.MULTILINE)
@@ -1,19 +1,32 @@
 """Shared utilities for the GitBook to Mintlify migrator."""
 
+import functools
 import re
 import os
 from urllib.parse import urlparse, urljoin
 
+_NON_SLUG_CHARS_RE = re.compile(r'[^\w\s-]')
+_SEPARATOR_RUN_RE = re.compile(r'[\s_-]+')
+_WHITESPACE_RUN_RE = re.compile(r'\s+')
+_UNSAFE_ASSET_CHARS_RE = re.compile(r'[^\w.\-]')
 
+
+@functools.lru_cache(maxsize=4096)
 def sanitize_filename(text: str) -> str:
     """Convert a title or URL path into a clean filename."""
     text = text.lower().strip()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[\s_]+', '-', text)
-    text = re.sub(r'-+', '-', text)
+    text = _NON_SLUG_CHARS_RE.sub('', text)
+    # Whitespace/underscore runs become '-', merged with any adjacent dashes
+    text = _SEPARATOR_RUN_RE.sub('-', text)
     return text.strip('-')
 
 
+@functools.lru_cache(maxsize=4096)
+def clean_asset_filename(name: str) -> str:
+    """Replace characters that are unsafe in an image filename with '-'."""
+    return _UNSAFE_ASSET_CHARS_RE.sub('-', name)
+
+
 def url_to_filepath(url: str, base_url: str) -> str:
     """Convert a full URL to a relative file path for Mintlify."""
     parsed = urlparse(url)
@@ -21,7 +34,10 @@ def url_to_filepath(url: str, base_url: str) -> str:
     if not path:
         return 'index'
     # Remove trailing slashes and file extensions
-    path = re.sub(r'\.(html|htm)$', '', path)
+    if path.endswith('.html'):
+        path = path[:-5]
+    elif path.endswith('.htm'):
+        path = path[:-4]
     # Clean each segment
     segments = [sanitize_filename(seg) for seg in path.split('/') if seg]
     return '/'.join(segments)
@@ -38,18 +54,38 @@ def is_internal_link(href: str, base_url: str) -> bool:
     """Check if a link points to the same GitBook site."""
     if not href or href.startswith(('#', 'mailto:', 'tel:', 'javascript:')):
         return False
+    # Without a scheme or a // host prefix the link always resolves onto the
+    # base host. urlsplit strips leading spaces and drops tabs/newlines, which
+    # could expose a hidden //, so those fall through to the full join.
+    if ':' not in href and href.isprintable() and not href.startswith(('//', ' ')):
+        return True
     resolved = urljoin(base_url, href)
-    return urlparse(resolved).netloc == urlparse(base_url).netloc
+    return urlparse(resolved).netloc == _netloc(base_url)
+
+
+@functools.lru_cache(maxsize=64)
+def _netloc(url: str) -> str:
+    """Return the netloc of a URL."""
+    return urlparse(url).netloc
+
+
+# Directories already created by ensure_dir during this run
+_created_dirs: set[str] = set()
 
 
 def ensure_dir(path: str):
-    """Create directory if it doesn't exist."""
-    os.makedirs(os.path.dirname(path), exist_ok=True)
+    """Create the parent directory of path if it doesn't exist."""
+    directory = os.path.dirname(path)
+    # Pages cluster in a few directories; skip makedirs' stat for known ones
+    if directory in _created_dirs:
+        return
+    os.makedirs(directory, exist_ok=True)
+    _created_dirs.add(directory)
 
 
 def slugify(text: str) -> str:
     """Create a URL-safe slug from text."""
     text = text.lower().strip()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[\s]+', '-', text)
+    text = _NON_SLUG_CHARS_RE.sub('', text)
+    text = _WHITESPACE_RUN_RE.sub('-', text)
     return text.strip('-')